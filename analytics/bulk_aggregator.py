@@ -0,0 +1,227 @@
+"""
+Bulk Aggregation of Time Tracker Files
+Combines exported analytics files and raw time logs from many students into
+cohort-level statistics, without going through the GitHub API.
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# time_tracker.py lives at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from time_tracker import TimeLogStore, efficiency_score
+
+
+CATEGORIES = (
+    'basic_python',
+    'intermediate_python',
+    'advanced_python',
+    'backend_development',
+    'setup_debugging'
+)
+
+# One row per student; also the column order of the columnar output
+COLUMNS = (
+    'student', 'source', 'path', 'recorded', 'total_active_time',
+    *CATEGORIES,
+    'submission_count', 'session_count', 'efficiency_score'
+)
+
+TIME_LOG_NAME = '.assessment_time_log.json'
+JOURNAL_NAME = '.assessment_time_log.jsonl'
+
+
+def find_tracker_files(root):
+    """
+    Yield exported analytics_<student>_<date>.json files and time logs under
+    root. A time log is its snapshot, or its journal when there is no
+    snapshot; either way it is yielded once.
+    """
+    for directory, subdirs, files in os.walk(root):
+        subdirs[:] = [d for d in subdirs if d not in ('.git', '__pycache__', 'node_modules')]
+        for name in files:
+            if (name == TIME_LOG_NAME
+                    or (name == JOURNAL_NAME and TIME_LOG_NAME not in files)
+                    or (name.startswith('analytics_') and name.endswith('.json'))):
+                yield os.path.join(directory, name)
+
+
+def summarize_file(path):
+    """
+    Reduce one tracker file to a row tuple in COLUMNS order.
+    Runs in a worker process; returns None for unreadable or foreign files.
+    """
+    name = os.path.basename(path)
+    try:
+        if name in (TIME_LOG_NAME, JOURNAL_NAME):
+            # Replays the journal next to the log, if the student has one
+            data, _ = TimeLogStore(os.path.join(os.path.dirname(path), TIME_LOG_NAME)).load('anonymous')
+            source = 'log'
+            recorded = data.get('last_submission') or ''
+            score = efficiency_score(data['category_time'])
+        else:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            source = 'export'
+            # analytics_<student>_<YYYYMMDD>.json
+            recorded = name[:-len('.json')].rsplit('_', 1)[-1]
+            score = data.get('efficiency_score')
+            if score is None:
+                score = efficiency_score(data['category_time'])
+        category_time = data['category_time']
+        return (
+            data.get('student_id', 'anonymous'),
+            source,
+            path,
+            recorded,
+            float(data['total_active_time']),
+            *(float(category_time.get(category, 0)) for category in CATEGORIES),
+            int(data.get('submission_count', 0)),
+            len(data.get('sessions', ())),
+            float(score)
+        )
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+class BulkAggregator:
+    """
+    Aggregates thousands of tracker files into cohort statistics.
+    Files are parsed in a process pool and reduced to one small row each,
+    so memory grows with the number of students, not the size of the logs.
+    """
+
+    def __init__(self, root, workers=None, chunksize=64):
+        self.root = root
+        self.workers = workers
+        self.chunksize = chunksize
+        self.files_scanned = 0
+        self.files_skipped = 0
+        self.rows = {}
+
+    def collect(self):
+        """Parse every tracker file, keeping the most current row per student"""
+        paths = list(find_tracker_files(self.root))
+        self.files_scanned = len(paths)
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            for row in pool.map(summarize_file, paths, chunksize=self.chunksize):
+                if row is None:
+                    self.files_skipped += 1
+                    continue
+                self._keep(row)
+
+        print(f"Parsed {self.files_scanned - self.files_skipped} of {self.files_scanned} tracker files")
+        return self.rows
+
+    def _keep(self, row):
+        student, source, path = row[0], row[1], row[2]
+        # Untagged logs cannot be matched to anyone, so each one counts separately
+        key = path if student == 'anonymous' else student
+        current = self.rows.get(key)
+        # Prefer the live time log over exports, then the newest export
+        if current is None or (source == 'log', row[3]) >= (current[1] == 'log', current[3]):
+            self.rows[key] = row
+
+    def columns(self):
+        """The collected rows as {column: [values]}"""
+        rows = sorted(self.rows.values())
+        return {column: [row[index] for row in rows] for index, column in enumerate(COLUMNS)}
+
+    def cohort_summary(self):
+        """Per-category time distributions and an efficiency-score histogram"""
+        columns = self.columns()
+        totals = columns['total_active_time']
+
+        category_distribution = {}
+        for category in CATEGORIES:
+            values = sorted(columns[category])
+            shares = [
+                value / total * 100
+                for value, total in zip(columns[category], totals)
+                if total > 0
+            ]
+            category_distribution[category] = {
+                'mean': _mean(values),
+                'median': _percentile(values, 50),
+                'p25': _percentile(values, 25),
+                'p75': _percentile(values, 75),
+                'min': round(values[0], 2) if values else 0,
+                'max': round(values[-1], 2) if values else 0,
+                'mean_share_percent': _mean(shares)
+            }
+
+        histogram = {f"{low}-{low + 10}": 0 for low in range(0, 100, 10)}
+        for score in columns['efficiency_score']:
+            low = min(int(score) // 10 * 10, 90)
+            histogram[f"{low}-{low + 10}"] += 1
+
+        return {
+            'students': len(totals),
+            'files_scanned': self.files_scanned,
+            'files_skipped': self.files_skipped,
+            'total_active_time': {
+                'mean': _mean(totals),
+                'median': _percentile(sorted(totals), 50)
+            },
+            'category_distribution': category_distribution,
+            'efficiency_mean': _mean(columns['efficiency_score']),
+            'efficiency_histogram': histogram
+        }
+
+    def write_columns(self, output_file):
+        """Write per-student columns as Parquet (.parquet, needs pyarrow) or columnar JSON"""
+        columns = self.columns()
+        if str(output_file).endswith('.parquet'):
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise RuntimeError("Writing .parquet output requires pyarrow (pip install pyarrow)")
+            pq.write_table(pa.table(columns), output_file)
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(columns, f)
+        print(f"📄 Student columns written to {output_file}")
+
+
+def _mean(values):
+    return round(sum(values) / len(values), 2) if values else 0
+
+
+def _percentile(sorted_values, percent):
+    if not sorted_values:
+        return 0
+    index = round((len(sorted_values) - 1) * percent / 100)
+    return round(sorted_values[index], 2)
+
+
+def main():
+    """Aggregate a directory tree of tracker files from the command line"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('root', help="Directory containing exported analytics files and/or time logs")
+    parser.add_argument('--output-dir', default='analytics_output')
+    parser.add_argument('--format', choices=('json', 'parquet'), default='json',
+                        help="Format of the per-student columnar file")
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    Path(args.output_dir).mkdir(exist_ok=True)
+    aggregator = BulkAggregator(args.root, workers=args.workers)
+
+    print(f"🔍 Scanning {args.root} for tracker files...")
+    aggregator.collect()
+    aggregator.write_columns(os.path.join(args.output_dir, f"cohort_columns.{args.format}"))
+
+    summary_file = os.path.join(args.output_dir, 'cohort_summary.json')
+    with open(summary_file, 'w') as f:
+        json.dump(aggregator.cohort_summary(), indent=2, fp=f)
+    print(f"📊 Cohort summary written to {summary_file}")
+
+
+if __name__ == "__main__":
+    main()
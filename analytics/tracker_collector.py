@@ -0,0 +1,201 @@
+"""
+Lab Collector for Time Tracker Events
+Receives session and submission events from time_tracker.py on lab machines
+and serves live per-category cohort totals, without GitHub round trips.
+
+Point the lab machines at it with:
+    export ASSESSMENT_COLLECTOR_URL=http://<collector-host>:8765
+"""
+
+import argparse
+import json
+import queue
+import sqlite3
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    student_id TEXT NOT NULL,
+    host TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    category TEXT,
+    minutes REAL,
+    time TEXT,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (student_id, host, seq)
+);
+CREATE INDEX IF NOT EXISTS events_by_type_category ON events (type, category);
+CREATE INDEX IF NOT EXISTS events_by_student ON events (student_id);
+"""
+
+
+class CollectorStore:
+    """
+    SQLite store for collected events.
+    A single writer thread commits queued batches together, so many
+    concurrent uploads cost one transaction instead of one each.
+    """
+
+    def __init__(self, db_path, batch_size=1000):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self._queue = queue.Queue()
+        self._writer = sqlite3.connect(db_path, check_same_thread=False)
+        self._writer.executescript(SCHEMA)
+        self._thread = threading.Thread(target=self._write_batches, name='collector-writer', daemon=True)
+        self._thread.start()
+
+    def ingest(self, events, timeout=5.0):
+        """Queue events for the writer; True once they are committed"""
+        done = threading.Event()
+        self._queue.put((events, done))
+        return done.wait(timeout)
+
+    def _write_batches(self):
+        while True:
+            pending = [self._queue.get()]
+            count = len(pending[0][0])
+            # Group whatever else is already waiting into the same transaction
+            while count < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                pending.append(item)
+                count += len(item[0])
+
+            try:
+                rows = [row for events, _ in pending for row in map(_event_row, events) if row]
+                try:
+                    self._insert(rows)
+                except (sqlite3.Error, OverflowError):
+                    # One unstorable row must not cost the whole batch
+                    for row in rows:
+                        try:
+                            self._insert([row])
+                        except (sqlite3.Error, OverflowError):
+                            pass
+            finally:
+                # Never leave an upload waiting: a dead writer would turn every POST into a 503
+                for _, done in pending:
+                    done.set()
+
+    def _insert(self, rows):
+        with self._writer:
+            # Retried uploads resend events; the primary key drops duplicates
+            self._writer.executemany(
+                "INSERT OR IGNORE INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def totals(self):
+        """Live per-category totals across the cohort"""
+        with sqlite3.connect(self.db_path) as reader:
+            categories = {
+                category: {'minutes': round(minutes, 2), 'sessions': sessions, 'students': students}
+                for category, minutes, sessions, students in reader.execute(
+                    "SELECT category, SUM(minutes), COUNT(*), COUNT(DISTINCT student_id) "
+                    "FROM events WHERE type = 'session_end' GROUP BY category"
+                )
+            }
+            students, submissions = reader.execute(
+                "SELECT COUNT(DISTINCT student_id), "
+                "COALESCE(SUM(type = 'submission'), 0) FROM events"
+            ).fetchone()
+        return {'students': students, 'submissions': submissions, 'categories': categories}
+
+
+def _event_row(event):
+    """Flatten one tracker event into an events table row (None if malformed)"""
+    try:
+        session = event.get('session') or {}
+        minutes = event.get('minutes')
+        return (
+            str(event['student_id']),
+            str(event.get('host', '')),
+            int(event['seq']),
+            str(event['type']),
+            _text(session.get('category', event.get('category'))),
+            None if minutes is None else float(minutes),
+            _text(event.get('time') or session.get('end_time')),
+            json.dumps(event)
+        )
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return None
+
+
+def _text(value):
+    """An optional text column: None or a str, anything else is malformed"""
+    if value is not None and not isinstance(value, str):
+        raise TypeError(f"expected text, got {type(value).__name__}")
+    return value
+
+
+class CollectorHandler(BaseHTTPRequestHandler):
+    """POST /events ingests a batch; GET /totals returns cohort totals"""
+
+    store = None
+
+    def do_POST(self):
+        if self.path != '/events':
+            return self._reply(404, {'error': 'not found'})
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            events = json.loads(self.rfile.read(length))['events']
+        except (ValueError, KeyError, TypeError):
+            return self._reply(400, {'error': 'expected {"events": [...]}'})
+        if not isinstance(events, list):
+            return self._reply(400, {'error': 'events must be a list'})
+        if not self.store.ingest(events):
+            return self._reply(503, {'error': 'ingestion timed out'})
+        self._reply(200, {'accepted': len(events)})
+
+    def do_GET(self):
+        if self.path == '/totals':
+            self._reply(200, self.store.totals())
+        elif self.path == '/health':
+            self._reply(200, {'status': 'ok'})
+        else:
+            self._reply(404, {'error': 'not found'})
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 200 machines posting every few minutes would flood the console
+        pass
+
+
+def make_server(host='0.0.0.0', port=8765, db_path='collector.db'):
+    """Build (but do not start) a collector HTTP server"""
+    handler = type('BoundCollectorHandler', (CollectorHandler,), {'store': CollectorStore(db_path)})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main():
+    """Run the collector until interrupted"""
+    parser = argparse.ArgumentParser(description="Collect time tracker events from lab machines")
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--db', default='collector.db', help="SQLite database file")
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.db)
+    print(f"📡 Collector listening on http://{args.host}:{args.port} (database: {args.db})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("👋 Collector stopped")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
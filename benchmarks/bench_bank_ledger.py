@@ -0,0 +1,114 @@
+"""
+Benchmark: transaction throughput of one Question6BankAccount object per
+account against AccountLedger, per call and through apply_batch, with and
+without striped locks (also from several threads), plus the memory each
+layout needs for the accounts themselves.
+
+Run from the repository root:
+    python benchmarks/bench_bank_ledger.py [--accounts 1000000] [--transactions 2000000]
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from questions.intermediate_python import AccountLedger, Question6BankAccount
+
+
+def per_object(accounts, transactions):
+    for number, kind, amount in transactions:
+        account = accounts[number]
+        if kind == 'deposit':
+            account.deposit(amount)
+        else:
+            account.withdraw(amount)
+
+
+def per_call(ledger, transactions):
+    for number, kind, amount in transactions:
+        if kind == 'deposit':
+            ledger.deposit(number, amount)
+        else:
+            ledger.withdraw(number, amount)
+
+
+def in_batches(ledger, transactions, batch_size=10_000):
+    for start in range(0, len(transactions), batch_size):
+        ledger.apply_batch(transactions[start:start + batch_size])
+
+
+def in_threads(ledger, transactions, threads):
+    step = -(-len(transactions) // threads)
+    workers = [
+        threading.Thread(target=in_batches, args=(ledger, transactions[i:i + step]))
+        for i in range(0, len(transactions), step)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+def timed(label, size, func, *args):
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {elapsed * 1e3:>10.1f} ms {size / elapsed / 1e6:>10.2f} M txn/s")
+
+
+def allocated(label, build):
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{label:<36} {size / 1e6:>10.1f} MB")
+    return result
+
+
+def ledger_with(accounts, **kwargs):
+    ledger = AccountLedger(**kwargs)
+    for number in range(accounts):
+        ledger.open_account(number, 100)
+    return ledger
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--accounts', type=int, default=10**6)
+    parser.add_argument('--transactions', type=int, default=2 * 10**6)
+    parser.add_argument('--threads', type=int, default=8)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    transactions = [
+        (rng.randrange(args.accounts), rng.choice(('deposit', 'withdraw')), rng.randint(1, 150))
+        for _ in range(args.transactions)
+    ]
+    size = len(transactions)
+    print(f"{size:,} transactions over {args.accounts:,} accounts\n")
+
+    print("Memory for the accounts")
+    allocated("Question6BankAccount objects",
+              lambda: {number: Question6BankAccount(number, 100) for number in range(args.accounts)})
+    allocated("AccountLedger", lambda: ledger_with(args.accounts))
+
+    print("\nThroughput")
+    accounts = {number: Question6BankAccount(number, 100) for number in range(args.accounts)}
+    timed("Question6BankAccount objects", size, per_object, accounts, transactions)
+    del accounts
+
+    timed("AccountLedger, per call", size, per_call, ledger_with(args.accounts), transactions)
+    timed("AccountLedger.apply_batch", size, in_batches, ledger_with(args.accounts), transactions)
+    timed("thread-safe apply_batch", size, in_batches,
+          ledger_with(args.accounts, thread_safe=True), transactions)
+    timed(f"thread-safe apply_batch, {args.threads} threads", size, in_threads,
+          ledger_with(args.accounts, thread_safe=True), transactions, args.threads)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: Question14ThreadSafeCounter (one lock) against ShardedCounter
+(per-thread cells) with 1 to 64 threads sharing a fixed number of
+increments. If a free-threaded CPython (python3.13t / python3.14t) is on
+PATH, the same table is also produced under it, where threads really run
+in parallel.
+
+Run from the repository root:
+    python benchmarks/bench_counter.py [--ops 2000000] [--no-free-threaded]
+"""
+
+import argparse
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from questions.advanced_python import Question14ThreadSafeCounter, ShardedCounter
+
+
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32, 64)
+
+
+def run(counter_class, threads, ops):
+    counter = counter_class()
+    per_thread = ops // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        increment = counter.increment
+        barrier.wait()
+        for _ in range(per_thread):
+            increment()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    assert counter.get_value() == per_thread * threads
+    return per_thread * threads / elapsed / 1e6
+
+
+def build_name():
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    return f"Python {sys.version.split()[0]}, {'GIL' if gil_enabled else 'free-threaded'}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--ops', type=int, default=2 * 10**6)
+    parser.add_argument('--no-free-threaded', action='store_true',
+                        help="Do not re-run under a free-threaded interpreter found on PATH")
+    args = parser.parse_args()
+
+    print(f"{build_name()}: {args.ops:,} increments, M ops/s\n")
+    print(f"{'threads':>8} {'single lock':>12} {'sharded':>12} {'speedup':>9}")
+    for threads in THREAD_COUNTS:
+        locked = run(Question14ThreadSafeCounter, threads, args.ops)
+        sharded = run(ShardedCounter, threads, args.ops)
+        print(f"{threads:>8} {locked:>12.2f} {sharded:>12.2f} {sharded / locked:>8.1f}x")
+
+    if args.no_free_threaded or not getattr(sys, '_is_gil_enabled', lambda: True)():
+        return
+    for name in ('python3.14t', 'python3.13t'):
+        interpreter = shutil.which(name)
+        if interpreter:
+            print()
+            subprocess.run([interpreter, __file__, '--ops', str(args.ops), '--no-free-threaded'])
+            break
+
+
+if __name__ == "__main__":
+    main()
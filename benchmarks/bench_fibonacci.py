@@ -0,0 +1,73 @@
+"""
+Benchmark: fast-doubling Fibonacci (question_5_fibonacci) against the
+linear loop, for n = 10^3 ... 10^6, and the offset and chunked modes of
+question_12_fibonacci_generator.
+
+Run from the repository root:
+    python benchmarks/bench_fibonacci.py [--loop-limit N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from questions.advanced_python import question_12_fibonacci_generator
+from questions.basic_python import fibonacci_many, fibonacci_pair, question_5_fibonacci
+
+
+def linear_fibonacci(n):
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+def best_of(repeats, func, *args):
+    best = float('inf')
+    for _ in range(repeats):
+        fibonacci_pair.cache_clear()
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--loop-limit', type=int, default=10**5,
+                        help="Largest n to time the linear loop at (it is slow beyond this)")
+    args = parser.parse_args()
+
+    print(f"{'n':>10} {'fast doubling':>15} {'linear loop':>15} {'speedup':>10}")
+    for exponent in range(3, 7):
+        n = 10 ** exponent
+        fast = best_of(3, question_5_fibonacci, n)
+        if n <= args.loop_limit:
+            assert question_5_fibonacci(n) == linear_fibonacci(n)
+            loop = best_of(1, linear_fibonacci, n)
+            print(f"{n:>10} {fast * 1e3:>12.3f} ms {loop * 1e3:>12.3f} ms {loop / fast:>9.0f}x")
+        else:
+            print(f"{n:>10} {fast * 1e3:>12.3f} ms {'(skipped)':>15}")
+
+    indices = list(range(10**5, 10**5 + 1000))
+    batch = best_of(3, fibonacci_many, indices)
+    single = best_of(1, lambda: [question_5_fibonacci(i) for i in indices])
+    print(f"\nfibonacci_many over 1000 consecutive indices near 10^5: "
+          f"{batch * 1e3:.1f} ms (one call per index: {single * 1e3:.1f} ms)")
+
+    offset = best_of(3, lambda: list(question_12_fibonacci_generator(1000, start=10**6)))
+    print(f"generator, items 10^6 ... 10^6+999 via start=: {offset * 1e3:.1f} ms")
+
+    # Small indices, so per-item generator overhead rather than big-int
+    # arithmetic dominates
+    rounds = 10**4
+    single = best_of(3, lambda: [list(question_12_fibonacci_generator(90)) for _ in range(rounds)])
+    chunked = best_of(3, lambda: [list(question_12_fibonacci_generator(90, chunk_size=90)) for _ in range(rounds)])
+    print(f"generator, first 90 items x {rounds}: one by one {single * 1e3:.1f} ms, "
+          f"as one chunk {chunked * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
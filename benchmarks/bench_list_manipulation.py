@@ -0,0 +1,67 @@
+"""
+Benchmark: question_10_list_manipulation on heavily duplicated integers as
+a plain list, a generator, array.array and NumPy (if installed), with and
+without a compact array result, against the quadratic `in`-check version
+on a small sample.
+
+Run from the repository root:
+    python benchmarks/bench_list_manipulation.py [--size 10000000] [--distinct 10000]
+"""
+
+import argparse
+import array
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from questions.intermediate_python import numpy, question_10_list_manipulation
+
+
+def quadratic(numbers):
+    """The straightforward version: dedupe with `in` on a list"""
+    unique = []
+    for n in numbers:
+        if n not in unique:
+            unique.append(n)
+    return [n for n in sorted(unique) if n % 2 == 0]
+
+
+def timed(label, size, func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed * 1e3:>10.1f} ms {size / elapsed / 1e6:>10.1f} M items/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, default=10**7)
+    parser.add_argument('--distinct', type=int, default=10**4)
+    args = parser.parse_args()
+    size = args.size
+
+    rng = random.Random(42)
+    plain = [rng.randrange(args.distinct) for _ in range(size)]
+    print(f"Processing {size:,} integers with {args.distinct:,} distinct values\n")
+
+    sample = plain[:20_000]
+    timed("quadratic, 20k sample", len(sample), quadratic, sample)
+    timed("plain list", size, question_10_list_manipulation, plain)
+    timed("generator", size, question_10_list_manipulation, (n for n in plain))
+    timed("plain list, as_array=True", size, question_10_list_manipulation, plain, as_array=True)
+
+    values = array.array('q', plain)
+    del plain
+    timed("array.array", size, question_10_list_manipulation, values)
+    if numpy is not None:
+        ndarray = numpy.frombuffer(values, dtype=numpy.int64)
+        timed("numpy.ndarray", size, question_10_list_manipulation, ndarray)
+        timed("numpy.ndarray, as_array=True", size, question_10_list_manipulation, ndarray, as_array=True)
+    else:
+        print("numpy.ndarray                    (numpy not installed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark: question_1_sum_of_numbers throughput for a plain list against
+array.array, NumPy (if installed), a generator, and exact (fsum) mode.
+
+Run from the repository root:
+    python benchmarks/bench_sum.py [--size 100000000]
+The default of 10^7 keeps the plain list within a few hundred MB; at 10^8
+the list alone needs about 3 GB.
+"""
+
+import argparse
+import array
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from questions.basic_python import numpy, question_1_sum_of_numbers
+
+
+def timed(label, size, func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed * 1e3:>10.1f} ms {size / elapsed / 1e6:>10.1f} M items/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, default=10**7)
+    args = parser.parse_args()
+    size = args.size
+
+    values = array.array('d', (i * 0.5 for i in range(size)))
+    print(f"Summing {size:,} floats\n")
+
+    timed("array.array (buffer path)", size, question_1_sum_of_numbers, values)
+    timed("array.array, exact=True", size, question_1_sum_of_numbers, values, exact=True)
+    if numpy is not None:
+        ndarray = numpy.frombuffer(values, dtype=numpy.float64)
+        timed("numpy.ndarray", size, question_1_sum_of_numbers, ndarray)
+    else:
+        print("numpy.ndarray                    (numpy not installed)")
+    timed("generator (chunked)", size, question_1_sum_of_numbers, (i * 0.5 for i in range(size)))
+
+    plain = values.tolist()
+    timed("plain list", size, question_1_sum_of_numbers, plain)
+    timed("plain list, exact=True", size, question_1_sum_of_numbers, plain, exact=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark: vowel counting throughput in MB/s for question_4_count_vowels
+on one string, count_vowels_many over the lines of a corpus, and
+count_vowels_file serially and across a process pool.
+
+Run from the repository root:
+    python benchmarks/bench_vowels.py [--size-mb 512] [--workers 8]
+The corpus is written to a temporary file and removed afterwards.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from questions.basic_python import count_vowels_file, count_vowels_many, question_4_count_vowels
+
+
+LINE = "Zwölf Boxkämpfer jagen Viktor quer über den großen Sylter Deich; the quick brown fox.\n"
+
+
+def timed(label, size, func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed * 1e3:>10.1f} ms {size / elapsed / 1e6:>10.1f} MB/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size-mb', type=int, default=256)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    text = LINE * (args.size_mb * 10**6 // len(LINE.encode()))
+    size = len(text.encode())
+    print(f"Counting vowels in {size / 1e6:,.0f} MB of UTF-8 text\n")
+
+    timed("single string", size, question_4_count_vowels, text)
+    lines = text.splitlines()
+    timed("count_vowels_many (per line)", size, count_vowels_many, lines)
+    del lines
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'corpus.txt')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        del text
+        timed("file, mmap, 1 worker", size, count_vowels_file, path, workers=1)
+        timed("file, mmap, process pool", size, count_vowels_file, path,
+              workers=args.workers or os.cpu_count(), parallel_threshold=0)
+
+
+if __name__ == "__main__":
+    main()
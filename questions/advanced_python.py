@@ -4,20 +4,42 @@ These questions test advanced Python concepts including decorators,
 generators, context managers, concurrency, and advanced data manipulation.
 """
 
+import array
+import atexit
+import csv
+import inspect
+import json
+import mmap
+import multiprocessing
+import multiprocessing.util
+import os
 import time
 import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from functools import wraps
+from itertools import islice
 from contextlib import contextmanager
 from typing import Generator, List, Dict, Any
 
+from questions.basic_python import fibonacci_pair
 
-def question_11_timing_decorator(func):
+
+def question_11_timing_decorator(func=None, *, profile=False, sample=1, report_at_exit=False):
     """
     Question 11: Timing Decorator (6 points)
     
     Create a decorator that measures and prints the execution time of a function.
     The decorator should print: "Function {func_name} took {time:.4f} seconds"
     
+    With profile=True nothing is printed; calls are timed with
+    perf_counter_ns and aggregated in a FunctionProfile, available as
+    the wrapper's `profile` attribute, timing only every sample-th call
+    per thread. report_at_exit prints timing_report() when the
+    interpreter exits. Coroutine functions are timed until they return
+    (including time spent awaiting) and generators by the time spent
+    producing items, not by the consumer.
+    
     Args:
         func: Function to be decorated
         
@@ -31,12 +53,237 @@ def question_11_timing_decorator(func):
             return "done"
         
         # When called, should print timing information
+        
+        @question_11_timing_decorator(profile=True, sample=100)
+        def hot_function(x):
+            return x * 2
     """
-    # TODO: Implement the timing decorator
-    pass
+    if func is None:
+        return lambda f: question_11_timing_decorator(
+            f, profile=profile, sample=sample, report_at_exit=report_at_exit
+        )
+    
+    if profile:
+        timer = FunctionProfile(func.__qualname__, sample)
+        with _profiles_lock:
+            _profiles.append(timer)
+        if report_at_exit:
+            _print_report_at_exit()
+    else:
+        timer = _PrintTimer(func.__name__)
+    clock = time.perf_counter_ns
+    
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not timer.begin():
+                return await func(*args, **kwargs)
+            start = clock()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                timer.record(clock() - start)
+    elif inspect.isgeneratorfunction(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            generator = func(*args, **kwargs)
+            if not timer.begin():
+                return (yield from generator)
+            return (yield from _timed_generator(generator, timer.record))
+    else:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not timer.begin():
+                return func(*args, **kwargs)
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timer.record(clock() - start)
+    
+    if profile:
+        wrapper.profile = timer
+    return wrapper
+
+
+class _PrintTimer:
+    """Times every call and prints it, as Question 11 asks"""
+    
+    def __init__(self, name):
+        self.name = name
+    
+    def begin(self):
+        return True
+    
+    def record(self, elapsed_ns):
+        print(f"Function {self.name} took {elapsed_ns / 1e9:.4f} seconds")
+
+
+def _timed_generator(generator, record):
+    """Drive generator, timing only its own steps, and record the total"""
+    busy = 0
+    value, error = None, None
+    try:
+        while True:
+            start = time.perf_counter_ns()
+            try:
+                item = generator.send(value) if error is None else generator.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                busy += time.perf_counter_ns() - start
+            value, error = None, None
+            try:
+                value = yield item
+            except GeneratorExit:
+                raise
+            except BaseException as exc:
+                error = exc
+    finally:
+        generator.close()
+        record(busy)
+
+
+class _ProfileSlot:
+    """One thread's share of a FunctionProfile"""
+    
+    __slots__ = ('calls', 'timed', 'total', 'minimum', 'maximum', 'buckets')
+    
+    def __init__(self):
+        self.calls = 0
+        self.timed = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = 0
+        # buckets[b] counts durations d with d.bit_length() == b, i.e. 2**(b-1) <= d < 2**b ns
+        self.buckets = [0] * 65
 
 
-def question_12_fibonacci_generator(n):
+class FunctionProfile:
+    """
+    Aggregated timings of one function decorated with profile=True:
+    call count, sampled call count, total, min and max duration, and a
+    histogram with power-of-two buckets.
+    
+    Each thread accumulates into its own slot, so timing a call takes
+    no lock; snapshot() and report() merge the slots.
+    """
+    
+    def __init__(self, name, sample=1):
+        if sample < 1:
+            raise ValueError("sample must be at least 1")
+        self.name = name
+        self.sample = sample
+        self._local = threading.local()
+        self._slots = []
+        self._slots_lock = threading.Lock()
+    
+    def _slot(self):
+        try:
+            return self._local.slot
+        except AttributeError:
+            slot = self._local.slot = _ProfileSlot()
+            with self._slots_lock:
+                self._slots.append(slot)
+            return slot
+    
+    def begin(self):
+        """Count a call; True if this one should be timed"""
+        slot = self._slot()
+        slot.calls += 1
+        return slot.calls % self.sample == 0
+    
+    def record(self, elapsed_ns):
+        slot = self._slot()
+        slot.timed += 1
+        slot.total += elapsed_ns
+        if slot.minimum is None or elapsed_ns < slot.minimum:
+            slot.minimum = elapsed_ns
+        if elapsed_ns > slot.maximum:
+            slot.maximum = elapsed_ns
+        slot.buckets[min(elapsed_ns.bit_length(), 64)] += 1
+    
+    def reset(self):
+        with self._slots_lock:
+            for slot in self._slots:
+                slot.__init__()
+    
+    def snapshot(self):
+        """Merged totals as a dict; histogram maps bucket upper bound (ns) to count"""
+        with self._slots_lock:
+            slots = list(self._slots)
+        buckets = [sum(column) for column in zip(*(slot.buckets for slot in slots))] or [0] * 65
+        minimums = [slot.minimum for slot in slots if slot.minimum is not None]
+        return {
+            'calls': sum(slot.calls for slot in slots),
+            'timed': sum(slot.timed for slot in slots),
+            'total_ns': sum(slot.total for slot in slots),
+            'min_ns': min(minimums) if minimums else None,
+            'max_ns': max((slot.maximum for slot in slots), default=0),
+            'histogram': {1 << b: count for b, count in enumerate(buckets) if count}
+        }
+    
+    def report(self):
+        """Human-readable summary with the latency histogram"""
+        stats = self.snapshot()
+        if not stats['timed']:
+            return f"{self.name}: {stats['calls']} calls, none timed"
+        mean = stats['total_ns'] / stats['timed']
+        lines = [
+            f"{self.name}: {stats['calls']} calls, {stats['timed']} timed, "
+            f"mean {_format_ns(mean)}, min {_format_ns(stats['min_ns'])}, "
+            f"max {_format_ns(stats['max_ns'])}, "
+            f"p50 < {_format_ns(_histogram_percentile(stats, 50))}, "
+            f"p99 < {_format_ns(_histogram_percentile(stats, 99))}, "
+            f"est. total {_format_ns(mean * stats['calls'])}"
+        ]
+        widest = max(stats['histogram'].values())
+        for upper, count in stats['histogram'].items():
+            bar = '#' * max(1, round(count / widest * 40))
+            lines.append(f"  < {_format_ns(upper):>9} {count:>10} {bar}")
+        return '\n'.join(lines)
+
+
+def _histogram_percentile(stats, percent):
+    """Upper bound of the bucket holding the given percentile"""
+    rank = stats['timed'] * percent / 100
+    seen = 0
+    for upper, count in stats['histogram'].items():
+        seen += count
+        if seen >= rank:
+            return upper
+    return stats['max_ns']
+
+
+def _format_ns(ns):
+    for unit, scale in (('s', 1e9), ('ms', 1e6), ('us', 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.2f} {unit}"
+    return f"{ns:.0f} ns"
+
+
+_profiles = []
+_profiles_lock = threading.Lock()
+_report_registered = False
+
+
+def timing_report():
+    """Reports of every function decorated with profile=True"""
+    with _profiles_lock:
+        profiles = list(_profiles)
+    return '\n'.join(profile.report() for profile in profiles)
+
+
+def _print_report_at_exit():
+    global _report_registered
+    with _profiles_lock:
+        if _report_registered:
+            return
+        _report_registered = True
+    atexit.register(lambda: print(timing_report()))
+
+
+def question_12_fibonacci_generator(n, start=0, chunk_size=None, as_array=False):
     """
     Question 12: Fibonacci Generator (6 points)
     
@@ -45,6 +292,13 @@ def question_12_fibonacci_generator(n):
     
     Args:
         n (int): Number of Fibonacci numbers to generate
+        start (int): Index of the first number to yield (default 0); reached
+            in O(log start) steps through basic_python.fibonacci_pair
+        chunk_size (int): Yield lists of up to chunk_size numbers instead
+            of single numbers, so bulk consumers pay the generator
+            overhead once per chunk; only one chunk is held at a time
+        as_array (bool): With chunk_size, yield array.array('Q') chunks;
+            F(93) is the largest Fibonacci number that fits
         
     Yields:
         int: Next Fibonacci number
@@ -54,13 +308,46 @@ def question_12_fibonacci_generator(n):
         [0, 1, 1, 2, 3]
         >>> list(question_12_fibonacci_generator(8))
         [0, 1, 1, 2, 3, 5, 8, 13]
+        >>> list(question_12_fibonacci_generator(3, start=10))
+        [55, 89, 144]
+        >>> list(question_12_fibonacci_generator(5, chunk_size=2))
+        [[0, 1], [1, 2], [3]]
     """
-    # TODO: Implement the Fibonacci generator
-    pass
+    if start < 0:
+        raise ValueError("start must be non-negative")
+    if chunk_size is not None:
+        yield from _fibonacci_chunks(n, start, chunk_size, as_array)
+        return
+    a, b = fibonacci_pair(start)
+    for _ in range(n):
+        yield a
+        a, b = b, a + b
+
+
+# Index of the largest Fibonacci number below 2**64
+_FIBONACCI_UINT64_LIMIT = 93
+
+
+def _fibonacci_chunks(n, start, chunk_size, as_array):
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if as_array and n > 0 and start + n - 1 > _FIBONACCI_UINT64_LIMIT:
+        raise ValueError(f"F({start + n - 1}) does not fit an unsigned 64-bit array")
+    a, b = fibonacci_pair(start)
+    remaining = n
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        chunk = []
+        append = chunk.append
+        for _ in range(size):
+            append(a)
+            a, b = b, a + b
+        yield array.array('Q', chunk) if as_array else chunk
+        remaining -= size
 
 
 @contextmanager
-def question_13_file_manager(filename, mode='r'):
+def question_13_file_manager(filename, mode='r', buffer_size=-1, atomic=False):
     """
     Question 13: Context Manager (6 points)
     
@@ -72,9 +359,18 @@ def question_13_file_manager(filename, mode='r'):
     - Print "File opened: {filename}" when entering
     - Print "File closed: {filename}" when exiting
     
+    Besides the open() modes, mode='mmap' maps the file read-only and
+    yields a memoryview over it, so slices are zero-copy; the views must
+    not be used after the block. With atomic=True a 'w' mode writes to a
+    temporary file next to filename that replaces it only when the block
+    exits without an exception, so readers never see a partial file.
+    
     Args:
         filename (str): Name of the file to open
         mode (str): File mode (default 'r')
+        buffer_size (int): Passed to open() as buffering; -1 keeps the
+            default, larger values suit big sequential reads and writes
+        atomic (bool): Stage writes and rename on success
         
     Yields:
         file: File object
@@ -84,8 +380,51 @@ def question_13_file_manager(filename, mode='r'):
             f.write("Hello World")
         # Should print open/close messages
     """
-    # TODO: Implement the context manager
-    pass
+    if atomic and not mode.startswith('w'):
+        raise ValueError("atomic=True requires a 'w' mode")
+    if mode == 'mmap':
+        file_obj = open(filename, 'rb', buffering=0)
+    elif atomic:
+        temp_path = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+        file_obj = open(temp_path, mode, buffering=buffer_size)
+    else:
+        file_obj = open(filename, mode, buffering=buffer_size)
+    print(f"File opened: {filename}")
+    
+    mapped = view = None
+    committed = False
+    try:
+        if mode == 'mmap':
+            # mmap cannot map an empty file
+            if os.fstat(file_obj.fileno()).st_size:
+                mapped = mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+            view = memoryview(mapped if mapped is not None else b'')
+            yield view
+        else:
+            yield file_obj
+        if atomic:
+            file_obj.flush()
+            os.fsync(file_obj.fileno())
+            file_obj.close()
+            os.replace(temp_path, filename)
+            committed = True
+    finally:
+        # Exports (slices, iter_unpack, numpy.frombuffer) kept past the
+        # block keep the view and mapping open until they are gone
+        if view is not None:
+            try:
+                view.release()
+            except BufferError:
+                pass
+        if mapped is not None:
+            try:
+                mapped.close()
+            except BufferError:
+                pass
+        file_obj.close()
+        if atomic and not committed and os.path.exists(temp_path):
+            os.unlink(temp_path)
+        print(f"File closed: {filename}")
 
 
 class Question14ThreadSafeCounter:
@@ -113,24 +452,247 @@ class Question14ThreadSafeCounter:
     """
     
     def __init__(self):
-        # TODO: Initialize counter and lock
-        pass
+        self._value = 0
+        self._lock = threading.Lock()
+    
+    def increment(self):
+        with self._lock:
+            self._value += 1
+    
+    def decrement(self):
+        with self._lock:
+            self._value -= 1
+    
+    def add(self, n):
+        with self._lock:
+            self._value += n
+    
+    def get_value(self):
+        with self._lock:
+            return self._value
+    
+    def reset(self):
+        with self._lock:
+            self._value = 0
+
+
+class _CounterCell:
+    __slots__ = ('value',)
+    
+    def __init__(self):
+        self.value = 0
+
+
+class ShardedCounter:
+    """
+    Question14ThreadSafeCounter's API without a shared lock on updates.
+    
+    Every thread counts in its own cell, which only that thread writes,
+    so increments from many threads never contend; get_value() sums the
+    cells. Cells of threads that have exited are folded into one total
+    whenever a new thread registers. reset() records the current sum as
+    the new zero instead of clearing cells under their owners' feet.
+    
+    Example:
+        >>> counter = ShardedCounter()
+        >>> counter.add(5)
+        >>> counter.decrement()
+        >>> counter.get_value()
+        4
+    """
+    
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._cells = []        # (owner thread, cell)
+        self._retired = 0       # counts from cells of finished threads
+        self._zero = 0
+    
+    def _cell(self):
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell = self._local.cell = _CounterCell()
+            with self._lock:
+                live = []
+                for owner, other in self._cells:
+                    if owner.is_alive():
+                        live.append((owner, other))
+                    else:
+                        self._retired += other.value
+                live.append((threading.current_thread(), cell))
+                self._cells = live
+            return cell
     
     def increment(self):
-        # TODO: Thread-safe increment
-        pass
+        self._cell().value += 1
     
     def decrement(self):
-        # TODO: Thread-safe decrement
-        pass
+        self._cell().value -= 1
+    
+    def add(self, n):
+        self._cell().value += n
+    
+    def _total(self):
+        return self._retired + sum(cell.value for _, cell in self._cells)
     
     def get_value(self):
-        # TODO: Thread-safe get value
-        pass
+        with self._lock:
+            return self._total() - self._zero
     
     def reset(self):
-        # TODO: Thread-safe reset
-        pass
+        with self._lock:
+            self._zero = self._total()
+
+
+# Bumped in every forked child so ProcessSharedCounter instances copied by
+# fork notice they belong to a new process
+_process_generation = 0
+_claim_lock = threading.Lock()
+
+
+def _after_fork_in_child():
+    global _process_generation, _claim_lock
+    _process_generation += 1
+    _claim_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):  # Unix only; Windows cannot fork
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+class _ProcessBuffer:
+    """
+    One process's unpublished ProcessSharedCounter updates and the cell
+    they go to (shared_lock is None for a cell private to the process).
+    """
+    
+    __slots__ = ('cells', 'cell', 'shared_lock', 'generation', 'lock', 'pending', 'ops')
+    
+    def __init__(self, cells, cell, shared_lock, generation):
+        self.cells = cells
+        self.cell = cell
+        self.shared_lock = shared_lock
+        self.generation = generation
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.ops = 0
+    
+    def write(self):
+        """Publish the pending updates; the caller holds self.lock"""
+        if self.pending:
+            if self.shared_lock is None:
+                # Single writer per cell: an aligned 8-byte store, no lock
+                self.cells[self.cell] += self.pending
+            else:
+                with self.shared_lock:
+                    self.cells[self.cell] += self.pending
+            self.pending = 0
+        self.ops = 0
+    
+    def flush(self):
+        # A copy inherited through fork holds the parent's updates
+        if self.generation == _process_generation:
+            with self.lock:
+                self.write()
+
+
+class ProcessSharedCounter:
+    """
+    Question14ThreadSafeCounter's API shared by several processes.
+    
+    The count lives in shared memory (multiprocessing.RawArray) with one
+    cell per process, written only by that process, so updates need no
+    cross-process lock; the multiprocessing.Lock is only taken to hand
+    out cells, to reset, and for processes beyond max_processes, which
+    share one locked cell. Each process buffers its updates and writes
+    its cell every flush_every operations, on get_value()/reset()/flush(),
+    and when it exits. Other processes see a value at most flush_every
+    operations per process behind until then.
+    
+    Like multiprocessing locks, the counter must reach other processes
+    by inheritance: as a Process argument or through a pool initializer,
+    created with the same multiprocessing context (`context`) as they are.
+    
+    Example:
+        >>> counter = ProcessSharedCounter()
+        >>> counter.increment()
+        >>> counter.get_value()
+        1
+    """
+    
+    _ZERO, _CLAIMED, _SHARED, _FIRST_CELL = range(4)
+    
+    def __init__(self, flush_every=256, max_processes=64, context=None):
+        context = context or multiprocessing.get_context()
+        self.flush_every = flush_every
+        self._cells = context.RawArray('q', self._FIRST_CELL + max_processes)
+        self._lock = context.Lock()
+        self._reset_local()
+    
+    def __getstate__(self):
+        return {'flush_every': self.flush_every, '_cells': self._cells, '_lock': self._lock}
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._reset_local()
+    
+    def _reset_local(self):
+        # Nothing buffered or claimed by another process carries over
+        self._generation = None
+        self._buffer = None
+    
+    def _claim_cell(self):
+        self._reset_local()
+        cell, shared_lock = self._SHARED, self._lock
+        with self._lock:
+            claimed = self._cells[self._CLAIMED]
+            if self._FIRST_CELL + claimed < len(self._cells):
+                self._cells[self._CLAIMED] = claimed + 1
+                cell, shared_lock = self._FIRST_CELL + claimed, None
+        self._buffer = _ProcessBuffer(self._cells, cell, shared_lock, _process_generation)
+        self._generation = _process_generation
+        # Runs when this process exits (including multiprocessing workers)
+        # or the counter is collected; the buffer does not keep it alive
+        multiprocessing.util.Finalize(self, self._buffer.flush, exitpriority=10)
+    
+    def add(self, n):
+        if self._generation != _process_generation:
+            with _claim_lock:
+                if self._generation != _process_generation:
+                    self._claim_cell()
+        buffer = self._buffer
+        with buffer.lock:
+            buffer.pending += n
+            buffer.ops += 1
+            if buffer.ops >= self.flush_every:
+                buffer.write()
+    
+    def increment(self):
+        self.add(1)
+    
+    def decrement(self):
+        self.add(-1)
+    
+    def flush(self):
+        """Publish this process's buffered updates"""
+        if self._generation == _process_generation:
+            self._buffer.flush()
+    
+    def _total(self):
+        cells = self._cells
+        used = cells[self._CLAIMED]
+        return cells[self._SHARED] + sum(cells[self._FIRST_CELL:self._FIRST_CELL + used])
+    
+    def get_value(self):
+        self.flush()
+        with self._lock:
+            return self._total() - self._cells[self._ZERO]
+    
+    def reset(self):
+        self.flush()
+        with self._lock:
+            self._cells[self._ZERO] = self._total()
 
 
 def question_15_data_processor(data_list):
@@ -160,6 +722,138 @@ def question_15_data_processor(data_list):
         >>> question_15_data_processor(data)
         {'LA': 30.0, 'NYC': 23.5}
     """
-    # TODO: Implement advanced data processing using pure Python
-    # Note: Use built-in Python functions instead of pandas for compatibility
-    pass 
\ No newline at end of file
+    return _average_by_city(_aggregate_people(data_list))
+
+
+def _aggregate_people(people):
+    """Running [age total, count] per city for adults, in first-seen city order"""
+    groups = {}
+    for person in people:
+        age = person['age']
+        if age >= 18:
+            group = groups.get(person['city'])
+            if group is None:
+                groups[person['city']] = [age, 1]
+            else:
+                group[0] += age
+                group[1] += 1
+    return groups
+
+
+def _merge_groups(groups, part):
+    for city, (total, count) in part.items():
+        group = groups.get(city)
+        if group is None:
+            groups[city] = [total, count]
+        else:
+            group[0] += total
+            group[1] += count
+
+
+def _average_by_city(groups):
+    averages = {city: total / count for city, (total, count) in groups.items()}
+    # sorted() is stable, so cities with equal averages keep first-seen order
+    return dict(sorted(averages.items(), key=lambda item: item[1], reverse=True))
+
+
+def process_people_stream(source, workers=1, chunk_size=50_000, file_format=None, encoding='utf-8'):
+    """
+    question_15_data_processor over a stream, in one pass and O(cities)
+    memory: source is any iterable of person dicts, or the path of a
+    JSON Lines (.jsonl, .ndjson) or CSV (.csv, with a header row) file.
+    CSV ages are read as int, or float if they are not integral.
+    
+    With workers above 1 (None: CPU count) the input is cut into chunks
+    of chunk_size records that a process pool parses and aggregates, a
+    few chunks at a time; the partial (total, count) pairs are merged in
+    input order, so the result and its ordering match the single-process
+    result (float ages may differ in the last digit, as they are summed
+    in a different order).
+    """
+    if isinstance(source, (str, os.PathLike)):
+        file_format = file_format or _people_file_format(source)
+        tasks = _people_file_chunks(source, file_format, chunk_size, encoding)
+    else:
+        tasks = (('records', None, chunk) for chunk in _batched(iter(source), chunk_size))
+    
+    workers = workers or os.cpu_count() or 1
+    groups = {}
+    if workers == 1:
+        for task in tasks:
+            _merge_groups(groups, _aggregate_people_chunk(task))
+        return _average_by_city(groups)
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for task in tasks:
+            if len(pending) >= 2 * workers:
+                _merge_groups(groups, pending.popleft().result())
+            pending.append(pool.submit(_aggregate_people_chunk, task))
+        while pending:
+            _merge_groups(groups, pending.popleft().result())
+    return _average_by_city(groups)
+
+
+def _people_file_format(path):
+    extension = os.path.splitext(os.fspath(path))[1].lower()
+    if extension in ('.jsonl', '.ndjson'):
+        return 'jsonl'
+    if extension == '.csv':
+        return 'csv'
+    raise ValueError(f"Cannot tell the format of {path}; pass file_format='jsonl' or 'csv'")
+
+
+def _batched(iterator, size):
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _people_file_chunks(path, file_format, chunk_size, encoding):
+    """Yield (format, csv header, raw records) tasks; parsing is left to the workers"""
+    with open(path, 'r', encoding=encoding, newline='') as f:
+        if file_format == 'jsonl':
+            for lines in _batched(f, chunk_size):
+                yield file_format, None, lines
+            return
+        if file_format != 'csv':
+            raise ValueError(f"Unknown file format: {file_format}")
+        
+        header = next(csv.reader(_csv_records(f)), None)
+        records = _csv_records(f)
+        for batch in _batched(records, chunk_size):
+            yield file_format, header, batch
+
+
+def _csv_records(lines):
+    """Join physical lines into CSV records; a quoted field may span lines"""
+    record = ''
+    for line in lines:
+        record += line
+        # Quotes inside fields are doubled, so an odd count means still inside one
+        if record.count('"') % 2 == 0:
+            yield record
+            record = ''
+    if record:
+        yield record
+
+
+def _aggregate_people_chunk(task):
+    file_format, header, chunk = task
+    if file_format == 'records':
+        return _aggregate_people(chunk)
+    if file_format == 'jsonl':
+        return _aggregate_people(json.loads(line) for line in chunk if line.strip())
+    rows = csv.DictReader(chunk, fieldnames=header)
+    return _aggregate_people(
+        {'city': row['city'], 'age': _csv_number(row['age'])} for row in rows
+    )
+
+
+def _csv_number(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text) 
\ No newline at end of file
@@ -4,9 +4,26 @@ These questions test object-oriented programming, error handling,
 file operations, and advanced data structures.
 """
 
+import array
+import hashlib
+import heapq
 import json
+import math
+import os
+import string
+import threading
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import chain, compress
+from operator import itemgetter
 from typing import List, Dict, Any
 
+try:
+    import numpy
+except ImportError:  # Optional: only used to process array inputs natively
+    numpy = None
+
 
 class Question6BankAccount:
     """
@@ -33,20 +50,357 @@ class Question6BankAccount:
     """
     
     def __init__(self, account_number, initial_balance=0):
-        # TODO: Implement initialization
-        pass
+        if initial_balance < 0:
+            raise ValueError("Initial balance cannot be negative")
+        self.account_number = account_number
+        self.balance = initial_balance
     
     def deposit(self, amount):
-        # TODO: Implement deposit method
-        pass
+        if amount <= 0:
+            raise ValueError("Deposit amount must be positive")
+        self.balance += amount
     
     def withdraw(self, amount):
-        # TODO: Implement withdraw method, return True if successful, False otherwise
-        pass
+        if amount <= 0:
+            raise ValueError("Withdrawal amount must be positive")
+        if amount > self.balance:
+            return False
+        self.balance -= amount
+        return True
     
     def get_balance(self):
-        # TODO: Implement get_balance method
-        pass
+        return self.balance
+
+
+_OPEN, _DEPOSIT, _WITHDRAW = range(3)
+_TRANSACTION_KINDS = {'deposit': _DEPOSIT, 'withdraw': _WITHDRAW}
+_KIND_NAMES = ('open', 'deposit', 'withdraw')
+# Balances and amounts are never negative, so -1 in a compact array('q')
+# slot marks a value kept exactly in a side table instead (a float, or an
+# integer beyond 64 bits)
+_EXACT = -1
+
+
+class _LedgerStripe:
+    """
+    Append-only ledger columns (account index, kind, amount) with a lazily
+    built per-account index of positions for history().
+    """
+    
+    __slots__ = ('account', 'kind', 'amount', 'exact', '_runs', '_indexed')
+    
+    def __init__(self):
+        self.account = array.array('Q')
+        self.kind = array.array('B')
+        self.amount = array.array('q')
+        self.exact = {}
+        # Runs of positions sorted by account, oldest run first
+        self._runs = []
+        self._indexed = 0
+    
+    def append(self, account, kind, amount):
+        self.account.append(account)
+        self.kind.append(kind)
+        self._append_amount(amount)
+    
+    def _append_amount(self, amount):
+        try:
+            self.amount.append(amount)
+        except (TypeError, OverflowError):
+            self.exact[len(self.amount)] = amount
+            self.amount.append(_EXACT)
+    
+    def extend(self, transactions, indexes, kinds):
+        """Record the transactions whose kind is not 0 (rejected), in order"""
+        self.account.extend(compress(indexes, kinds))
+        self.kind.extend(compress(kinds, kinds))
+        start = len(self.amount)
+        try:
+            self.amount.extend(map(itemgetter(2), compress(transactions, kinds)))
+        except (TypeError, OverflowError):
+            del self.amount[start:]
+            for amount in map(itemgetter(2), compress(transactions, kinds)):
+                self._append_amount(amount)
+    
+    def entries(self, account):
+        """The account's (kind, amount) entries, oldest first"""
+        self._index_new_entries()
+        accounts, kinds, amounts = self.account, self.kind, self.amount
+        found = []
+        for run in self._runs:
+            # bisect has no key= before Python 3.10
+            low, high = 0, len(run)
+            while low < high:
+                middle = (low + high) // 2
+                if accounts[run[middle]] < account:
+                    low = middle + 1
+                else:
+                    high = middle
+            while low < len(run) and accounts[run[low]] == account:
+                position = run[low]
+                amount = amounts[position]
+                found.append((_KIND_NAMES[kinds[position]], self.exact[position] if amount == _EXACT else amount))
+                low += 1
+        return found
+    
+    def _index_new_entries(self):
+        end = len(self.kind)
+        if self._indexed == end:
+            return
+        by_account = self.account.__getitem__
+        runs = self._runs
+        # The sort is stable, so each account's positions stay oldest first
+        runs.append(array.array('Q', sorted(range(self._indexed, end), key=by_account)))
+        self._indexed = end
+        # Merging runs of similar size keeps O(log n) runs to search;
+        # Timsort merges two presorted runs in one linear pass
+        while len(runs) > 1 and len(runs[-2]) <= 2 * len(runs[-1]):
+            newer = runs.pop()
+            runs[-1] = array.array('Q', sorted(runs[-1] + newer, key=by_account))
+
+
+class AccountLedger:
+    """
+    Store for millions of accounts with Question6BankAccount semantics.
+    
+    Balances live in one array.array('q') indexed by account, and every
+    applied operation is appended to a compact, append-only ledger. Values
+    stay exact: a float balance or amount, or an integer beyond 64 bits, is
+    kept as is in a side table, so get_balance returns what the class would.
+    With thread_safe=True accounts are spread over `stripes` locks by index
+    and each stripe keeps its own ledger, so threads working on different
+    accounts rarely wait for each other.
+    
+    Examples:
+        >>> ledger = AccountLedger()
+        >>> ledger.open_account("12345", 100)
+        0
+        >>> ledger.apply_batch([("12345", "deposit", 50), ("12345", "withdraw", 500)])
+        array('B', [1, 0])
+        >>> ledger.get_balance("12345")
+        150
+    """
+    
+    def __init__(self, thread_safe=False, stripes=64):
+        self.thread_safe = thread_safe
+        self._stripes = stripes if thread_safe else 1
+        self._locks = [threading.Lock() if thread_safe else nullcontext() for _ in range(self._stripes)]
+        self._ledgers = [_LedgerStripe() for _ in range(self._stripes)]
+        self._accounts_lock = threading.Lock()
+        self._index = {}
+        self._numbers = []
+        self._balances = array.array('q')
+        self._exact = {}
+    
+    def __len__(self):
+        return len(self._numbers)
+    
+    def open_account(self, account_number, initial_balance=0):
+        """Add an account and return its index"""
+        if initial_balance < 0:
+            raise ValueError("Initial balance cannot be negative")
+        with self._accounts_lock:
+            if account_number in self._index:
+                raise ValueError(f"Account {account_number} already exists")
+            index = len(self._numbers)
+            self._numbers.append(account_number)
+            self._balances.append(0)
+            self._set_balance(index, initial_balance)
+            # Published last, once the balance slot exists
+            self._index[account_number] = index
+        stripe = index % self._stripes
+        with self._locks[stripe]:
+            self._ledgers[stripe].append(index, _OPEN, initial_balance)
+        return index
+    
+    def deposit(self, account_number, amount):
+        if amount <= 0:
+            raise ValueError("Deposit amount must be positive")
+        index = self._index[account_number]
+        if self.thread_safe:
+            with self._locks[index % self._stripes]:
+                self._deposit(index, amount)
+        else:
+            self._deposit(index, amount)
+    
+    def withdraw(self, account_number, amount):
+        if amount <= 0:
+            raise ValueError("Withdrawal amount must be positive")
+        index = self._index[account_number]
+        if self.thread_safe:
+            with self._locks[index % self._stripes]:
+                return self._withdraw(index, amount)
+        return self._withdraw(index, amount)
+    
+    def get_balance(self, account_number):
+        index = self._index[account_number]
+        if self.thread_safe:
+            # A writer may move the balance between its slot and the side table
+            with self._locks[index % self._stripes]:
+                return self._balance(index)
+        return self._balance(index)
+    
+    def _balance(self, index):
+        balance = self._balances[index]
+        return self._exact[index] if balance == _EXACT else balance
+    
+    def _set_balance(self, index, balance):
+        try:
+            self._balances[index] = balance
+        except (TypeError, OverflowError):
+            self._exact[index] = balance
+            self._balances[index] = _EXACT
+        else:
+            self._exact.pop(index, None)
+    
+    def _deposit(self, index, amount):
+        balance = self._balances[index]
+        if balance == _EXACT:
+            self._set_balance(index, self._exact[index] + amount)
+        else:
+            try:
+                self._balances[index] = balance + amount
+            except (TypeError, OverflowError):
+                self._set_balance(index, balance + amount)
+        self._ledgers[index % self._stripes].append(index, _DEPOSIT, amount)
+    
+    def _withdraw(self, index, amount):
+        balance = self._balances[index]
+        if balance == _EXACT:
+            balance = self._exact[index]
+            if amount > balance:
+                return False
+            self._set_balance(index, balance - amount)
+        elif amount > balance:
+            return False
+        else:
+            try:
+                self._balances[index] = balance - amount
+            except (TypeError, OverflowError):
+                self._set_balance(index, balance - amount)
+        self._ledgers[index % self._stripes].append(index, _WITHDRAW, amount)
+        return True
+    
+    def apply_batch(self, transactions):
+        """
+        Apply (account_number, 'deposit' | 'withdraw', amount) tuples in
+        order and return an array('B') with 1 for each applied transaction
+        and 0 for each rejected one (amount not positive, or a withdrawal
+        above the balance). Unknown accounts or kinds raise KeyError,
+        amounts that are not numbers TypeError, and entries that are not
+        three-item tuples TypeError or ValueError, with nothing from the
+        batch applied. In thread-safe mode each stripe's lock is taken once per
+        batch, not once per transaction.
+        """
+        if not isinstance(transactions, (list, tuple)):
+            transactions = list(transactions)
+        if self._stripes == 1:
+            with self._locks[0]:
+                return array.array('B', map(bool, self._apply(0, transactions)))
+        
+        # Validated up front, since stripes applied earlier are not undone
+        groups = [[] for _ in range(self._stripes)]
+        for position, (number, kind, amount) in enumerate(transactions):
+            index = self._index[number]
+            if kind not in _TRANSACTION_KINDS:
+                raise KeyError(kind)
+            # Raises TypeError for amounts that are not numbers; the rest
+            # of the rejected ones need no lock
+            if amount > 0:
+                # Per-account order is kept because an account maps to one stripe
+                groups[index % self._stripes].append(position)
+        results = bytearray(len(transactions))
+        for stripe, positions in enumerate(groups):
+            if positions:
+                group = [transactions[position] for position in positions]
+                with self._locks[stripe]:
+                    applied = self._apply(stripe, group)
+                for position, kind in zip(positions, applied):
+                    if kind:
+                        results[position] = 1
+        return array.array('B', results)
+    
+    def _apply(self, stripe, transactions):
+        """
+        Resolve and apply the transactions in one pass and record the
+        applied ones. Returns their kind codes, 0 where rejected; on an
+        error the balances are rolled back and nothing is recorded.
+        """
+        index_of = self._index
+        balances = self._balances
+        # Deposits need no store: only withdrawals and rejections overwrite
+        kinds = bytearray([_DEPOSIT]) * len(transactions)
+        indexes = array.array('Q', bytes(8 * len(transactions)))
+        # Balances as they were before a transaction handled by _apply_exact
+        saved = {}
+        position = 0
+        try:
+            for position, transaction in enumerate(transactions):
+                number, kind, amount = transaction
+                index = indexes[position] = index_of[number]
+                if kind not in _TRANSACTION_KINDS:
+                    raise KeyError(kind)
+                if not amount > 0:
+                    kinds[position] = 0
+                    continue
+                balance = balances[index]
+                if balance != _EXACT:
+                    try:
+                        if kind == 'deposit':
+                            balances[index] = balance + amount
+                        elif amount > balance:
+                            kinds[position] = 0
+                        else:
+                            balances[index] = balance - amount
+                            kinds[position] = _WITHDRAW
+                        continue
+                    except (TypeError, OverflowError):
+                        pass  # Not storable in the compact slot
+                self._apply_exact(position, index, kind, amount, kinds, saved)
+        except BaseException:
+            self._roll_back(transactions, indexes, kinds[:position], saved)
+            raise
+        self._ledgers[stripe].extend(transactions, indexes, kinds)
+        return kinds
+    
+    def _apply_exact(self, position, index, kind, amount, kinds, saved):
+        balance = self._balance(index)
+        if kind == 'withdraw':
+            if amount > balance:
+                kinds[position] = 0
+                return
+            balance -= amount
+            kinds[position] = _WITHDRAW
+        elif kind == 'deposit':
+            balance += amount
+        else:
+            raise KeyError(kind)
+        saved[position] = (self._balances[index], self._exact.get(index))
+        self._set_balance(index, balance)
+    
+    def _roll_back(self, transactions, indexes, kinds, saved):
+        """Undo the transactions kinds covers, newest first"""
+        balances = self._balances
+        for position in range(len(kinds) - 1, -1, -1):
+            index = indexes[position]
+            if position in saved:
+                slot, exact = saved[position]
+                if exact is not None:
+                    self._exact[index] = exact
+                balances[index] = slot
+                if exact is None:
+                    self._exact.pop(index, None)
+            elif kinds[position] == _WITHDRAW:
+                balances[index] += transactions[position][2]
+            elif kinds[position] == _DEPOSIT:
+                balances[index] -= transactions[position][2]
+    
+    def history(self, account_number):
+        """The account's applied operations as (kind, amount), oldest first"""
+        index = self._index[account_number]
+        stripe = index % self._stripes
+        with self._locks[stripe]:
+            return self._ledgers[stripe].entries(index)
 
 
 def question_7_safe_divide(a, b):
@@ -73,8 +427,53 @@ def question_7_safe_divide(a, b):
         >>> question_7_safe_divide("10", 2)
         None
     """
-    # TODO: Implement this function with proper error handling
-    pass
+    try:
+        return a / b
+    except (ZeroDivisionError, TypeError):
+        return None
+
+
+# Exact types whose division can only fail on a zero denominator
+_PLAIN_NUMBERS = (int, float)
+
+
+def safe_divide_many(numerators, denominators):
+    """
+    Divide two equal-length sequences element by element with the
+    semantics of question_7_safe_divide, without raising an exception
+    per failed pair.
+    
+    Lists and other sequences give a list with None where division is
+    not possible. Numeric NumPy arrays give a (float64 result, boolean
+    validity mask) pair computed in one vectorized pass, and array.array
+    inputs a (array('d'), array('B')) pair; invalid results are NaN.
+    
+    Examples:
+        >>> safe_divide_many([10, 10, "10"], [2, 0, 2])
+        [5.0, None, None]
+    """
+    if len(numerators) != len(denominators):
+        raise ValueError("numerators and denominators must have the same length")
+    
+    if numpy is not None and all(
+        isinstance(v, numpy.ndarray) and v.dtype.kind in 'biuf' for v in (numerators, denominators)
+    ):
+        valid = denominators != 0
+        result = numpy.divide(numerators, denominators, out=numpy.full(len(valid), numpy.nan), where=valid)
+        return result, valid
+    
+    if isinstance(numerators, array.array) and isinstance(denominators, array.array):
+        valid = array.array('B', [y != 0 for y in denominators])
+        result = array.array('d', [x / y if y else math.nan for x, y in zip(numerators, denominators)])
+        return result, valid
+    
+    plain = _PLAIN_NUMBERS
+    return [
+        (x / y if y else None) if type(x) in plain and type(y) in plain
+        # Anything else (str, Decimal, bool, ...) keeps the exact scalar semantics
+        else question_7_safe_divide(x, y)
+        for x, y in zip(numerators, denominators)
+    ]
 
 
 def question_8_word_frequency(text):
@@ -97,11 +496,93 @@ def question_8_word_frequency(text):
         >>> question_8_word_frequency("Python is great! Python rocks.")
         {'python': 2, 'is': 1, 'great': 1, 'rocks': 1}
     """
-    # TODO: Implement this function
-    pass
+    return dict(_count_words(text))
+
+
+_PUNCTUATION = str.maketrans('', '', string.punctuation)
+
+
+def _count_words(text):
+    """Lowercase, drop ASCII punctuation ("don't" -> "dont") and count whitespace-separated words"""
+    return Counter(text.lower().translate(_PUNCTUATION).split())
+
+
+def word_frequency_stream(source, top_k=None, workers=1, chunk_size=1 << 22, encoding='utf-8'):
+    """
+    Word frequencies over a file or a stream of text, with the same
+    tokenization as question_8_word_frequency.
+    
+    source is a file path (str or os.PathLike), read chunk_size
+    characters at a time, or any iterable of strings such as lines or
+    arbitrary pieces of a text; a word split across two pieces is counted
+    once. With workers above 1 (None: CPU count) chunks are counted in a
+    process pool, a few at a time, and the counters merged, so memory is
+    bounded by the vocabulary rather than the input.
+    
+    Returns a dict like question_8_word_frequency, or with top_k the k
+    most frequent (word, count) pairs, most frequent first, picked with
+    a heap instead of sorting the whole vocabulary.
+    
+    Examples:
+        >>> word_frequency_stream(["Hello wor", "ld, hello"])
+        {'hello': 2, 'world': 1}
+    """
+    chunks = _word_chunks(source, chunk_size, encoding)
+    workers = workers or os.cpu_count() or 1
+    totals = Counter()
+    first = next(chunks, None)
+    second = next(chunks, None)
+    if workers == 1 or second is None:
+        for chunk in chain((first, second), chunks):
+            if chunk is not None:
+                totals.update(_count_words(chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            for chunk in chain((first, second), chunks):
+                if len(pending) >= 2 * workers:
+                    totals.update(pending.popleft().result())
+                pending.append(pool.submit(_count_words, chunk))
+            while pending:
+                totals.update(pending.popleft().result())
+    
+    if top_k is None:
+        return dict(totals)
+    return heapq.nlargest(top_k, totals.items(), key=lambda item: item[1])
+
+
+def _word_chunks(source, chunk_size, encoding):
+    """Re-cut a file or string stream into pieces that end on whitespace"""
+    if isinstance(source, (str, os.PathLike)):
+        def read_file():
+            with open(source, 'r', encoding=encoding) as f:
+                yield from iter(lambda: f.read(chunk_size), '')
+        pieces = read_file()
+    else:
+        pieces = iter(source)
+    
+    buffer = []
+    buffered = 0
+    for piece in pieces:
+        buffer.append(piece)
+        buffered += len(piece)
+        if buffered < chunk_size:
+            continue
+        text = ''.join(buffer)
+        # Hold back the trailing partial word until the next piece arrives
+        cut = len(text)
+        while cut and not text[cut - 1].isspace():
+            cut -= 1
+        if cut:
+            yield text[:cut]
+            buffer, buffered = [text[cut:]], len(text) - cut
+        else:
+            buffer = [text]
+    if buffer:
+        yield ''.join(buffer)
 
 
-def question_9_file_operations(filename, data):
+def question_9_file_operations(filename, data, verify='parse'):
     """
     Question 9: JSON File Operations (5 points)
     
@@ -111,9 +592,16 @@ def question_9_file_operations(filename, data):
     3. Returns the data that was read
     4. Handles file operation errors gracefully
     
+    The file is written with write_json_atomic, so a crash never leaves
+    a truncated file behind.
+    
     Args:
         filename (str): Name of the file to write/read
         data (dict): Data to write to file
+        verify (str): 'parse' re-reads and parses the file; 'checksum'
+            only checks that the bytes on disk hash to what was written
+            and returns data itself, skipping the parse (for JSON-native
+            data, i.e. str keys and no tuples, the two are equal)
         
     Returns:
         dict: Data read from file, or None if error occurred
@@ -124,11 +612,69 @@ def question_9_file_operations(filename, data):
         >>> result == data
         True
     """
-    # TODO: Implement this function
-    pass
+    try:
+        write_json_atomic(filename, data, verify=verify == 'checksum')
+        if verify == 'checksum':
+            return data
+        with open(filename, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(',', ':'))
+
+
+def write_json_atomic(filename, data, verify=False, buffer_size=1 << 16):
+    """
+    Write data as compact UTF-8 JSON so that filename holds either the old
+    or the complete new contents, never a partial write.
+    
+    The JSON goes to a temporary file next to filename, buffer_size
+    characters at a time, straight from json's incremental encoder; it is
+    hashed while written, flushed to disk and only then renamed over
+    filename. With verify=True the file is also read back and compared
+    against the hash before the rename. Returns the SHA-256 hex digest of
+    the file. NaN and infinity raise ValueError, as they are not JSON.
+    """
+    temp_path = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+    digest = hashlib.sha256()
+    try:
+        with open(temp_path, 'wb') as f:
+            for block in _json_blocks(data, buffer_size):
+                digest.update(block)
+                f.write(block)
+            f.flush()
+            os.fsync(f.fileno())
+        
+        if verify:
+            check = hashlib.sha256()
+            with open(temp_path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    check.update(block)
+            if check.digest() != digest.digest():
+                raise OSError(f"Checksum mismatch writing {filename}")
+        os.replace(temp_path, filename)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    return digest.hexdigest()
+
+
+def _json_blocks(data, buffer_size):
+    """Yield the encoded JSON as UTF-8 blocks"""
+    pending, size = [], 0
+    for piece in _JSON_ENCODER.iterencode(data):
+        pending.append(piece)
+        size += len(piece)
+        if size >= buffer_size:
+            yield ''.join(pending).encode('utf-8')
+            pending, size = [], 0
+    yield ''.join(pending).encode('utf-8')
 
 
-def question_10_list_manipulation(numbers):
+def question_10_list_manipulation(numbers, as_array=False):
     """
     Question 10: Advanced List Manipulation (5 points)
     
@@ -138,8 +684,14 @@ def question_10_list_manipulation(numbers):
     3. Return only the even numbers
     4. Return the result as a new list
     
+    Any iterable of integers works. With NumPy installed, array.array
+    and NumPy inputs are masked and deduplicated in native code.
+    
     Args:
         numbers (list): List of integers
+        as_array (bool): Return a compact array instead of a list: a
+            NumPy array for NumPy input, otherwise an array.array with
+            the input's typecode (signed 64-bit for non-arrays)
         
     Returns:
         list: Processed list containing only unique, sorted, even numbers
@@ -152,5 +704,17 @@ def question_10_list_manipulation(numbers):
         >>> question_10_list_manipulation([10, 20, 10, 30, 20])
         [10, 20, 30]
     """
-    # TODO: Implement this function
-    pass 
\ No newline at end of file
+    if numpy is not None and isinstance(numbers, (numpy.ndarray, array.array)):
+        values = numpy.asarray(numbers)
+        # unique() sorts as it deduplicates
+        result = numpy.unique(values[values % 2 == 0])
+        if not as_array:
+            return result.tolist()
+        return result if isinstance(numbers, numpy.ndarray) else array.array(numbers.typecode, result.tobytes())
+    
+    # Dropping odd numbers first leaves less to hash, and sorting only the
+    # unique survivors is O(u log u) instead of repeated `in` scans of a list
+    result = sorted({n for n in numbers if n % 2 == 0})
+    if as_array:
+        return array.array(numbers.typecode if isinstance(numbers, array.array) else 'q', result)
+    return result 
\ No newline at end of file
@@ -10,15 +10,44 @@ import tempfile
 import os
 from io import StringIO
 from contextlib import redirect_stdout
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from questions.advanced_python import (
     question_11_timing_decorator,
+    timing_report,
     question_12_fibonacci_generator,
     question_13_file_manager,
     Question14ThreadSafeCounter,
-    question_15_data_processor
+    ShardedCounter,
+    ProcessSharedCounter,
+    question_15_data_processor,
+    process_people_stream
 )
 
 
+_pool_counter = None
+
+
+def _hammer_counter(counter, rounds):
+    """Worker: mixed updates, some still buffered when the process exits"""
+    for _ in range(rounds):
+        counter.increment()
+        counter.increment()
+        counter.decrement()
+    counter.add(7)
+
+
+def _set_pool_counter(counter):
+    global _pool_counter
+    _pool_counter = counter
+
+
+def _count_in_pool(n):
+    for _ in range(n):
+        _pool_counter.increment()
+    return n
+
+
 class TestQuestion11TimingDecorator:
     """Test Question 11: Timing Decorator (6 points)"""
     
@@ -65,6 +94,74 @@ class TestQuestion11TimingDecorator:
         assert hasattr(original_function, '__name__')
 
 
+class TestTimingDecoratorProfileMode:
+    """Test the aggregated profiling mode of Question 11"""
+    
+    def test_profile_mode_aggregates_silently(self):
+        """Test counts, sampling and the report without per-call output"""
+        @question_11_timing_decorator(profile=True, sample=4)
+        def square(x):
+            return x * x
+        
+        f = StringIO()
+        with redirect_stdout(f):
+            results = [square(i) for i in range(100)]
+        
+        assert results[9] == 81
+        assert f.getvalue() == ""
+        stats = square.profile.snapshot()
+        assert (stats['calls'], stats['timed']) == (100, 25)
+        assert sum(stats['histogram'].values()) == 25
+        assert stats['min_ns'] <= stats['max_ns']
+        assert "square: 100 calls, 25 timed" in timing_report()
+        square.profile.reset()
+        assert square.profile.snapshot()['calls'] == 0
+    
+    def test_profile_mode_across_threads(self):
+        """Test that per-thread accumulation loses no calls"""
+        @question_11_timing_decorator(profile=True)
+        def work():
+            return 1
+        
+        def run():
+            for _ in range(1000):
+                work()
+        
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert work.profile.snapshot()['timed'] == 8000
+    
+    def test_async_functions_and_generators(self):
+        """Test coroutine functions and generators in both modes"""
+        import asyncio
+        
+        @question_11_timing_decorator
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return "fetched"
+        
+        @question_11_timing_decorator(profile=True)
+        def countdown(n):
+            while n:
+                yield n
+                n -= 1
+            return "done"
+        
+        f = StringIO()
+        with redirect_stdout(f):
+            assert asyncio.run(fetch()) == "fetched"
+        assert "Function fetch took" in f.getvalue()
+        
+        assert list(countdown(3)) == [3, 2, 1]
+        generator = countdown(5)
+        next(generator)
+        generator.close()
+        assert countdown.profile.snapshot()['timed'] == 2
+
+
 class TestQuestion12FibonacciGenerator:
     """Test Question 12: Fibonacci Generator (6 points)"""
     
@@ -92,6 +189,22 @@ class TestQuestion12FibonacciGenerator:
         expected = [0]
         assert result == expected
     
+    def test_fibonacci_generator_start_offset(self):
+        """Test starting the sequence at an offset"""
+        full = list(question_12_fibonacci_generator(30))
+        assert list(question_12_fibonacci_generator(10, start=20)) == full[20:30]
+    
+    def test_fibonacci_generator_chunks(self):
+        """Test chunked output, with an offset and as arrays"""
+        flat = list(question_12_fibonacci_generator(23, start=7))
+        chunks = list(question_12_fibonacci_generator(23, start=7, chunk_size=5))
+        assert [len(chunk) for chunk in chunks] == [5, 5, 5, 5, 3]
+        assert [x for chunk in chunks for x in chunk] == flat
+        arrays = list(question_12_fibonacci_generator(94, chunk_size=50, as_array=True))
+        assert arrays[1][-1] == 12200160415121876738
+        with pytest.raises(ValueError):
+            list(question_12_fibonacci_generator(95, chunk_size=50, as_array=True))
+    
     def test_fibonacci_generator_is_generator(self):
         """Test that function returns a generator"""
         fib_gen = question_12_fibonacci_generator(5)
@@ -172,6 +285,64 @@ class TestQuestion13FileManager:
                 os.unlink(filename)
 
 
+class TestFileManagerModes:
+    """Test the buffered, mmap and atomic modes of Question 13"""
+    
+    def test_mmap_mode_yields_memoryview(self):
+        """Test zero-copy reads through a read-only memoryview"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, 'data.bin')
+            with open(filename, 'wb') as f:
+                f.write(bytes(range(256)) * 16)
+            empty = os.path.join(temp_dir, 'empty.bin')
+            open(empty, 'wb').close()
+            
+            f = StringIO()
+            with redirect_stdout(f):
+                with question_13_file_manager(filename, 'mmap') as view:
+                    assert view.readonly
+                    assert view[256:260].tobytes() == bytes([0, 1, 2, 3])
+                    assert len(view) == 4096
+                with question_13_file_manager(empty, 'mmap') as view:
+                    assert len(view) == 0
+                with question_13_file_manager(filename, 'rb', buffer_size=1 << 20) as file_obj:
+                    assert len(file_obj.read()) == 4096
+            assert f.getvalue().count("File closed:") == 3
+    
+    def test_mmap_mode_closes_with_live_export(self):
+        """Test that an export kept past the block does not mask the body's exception"""
+        import struct
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, 'data.bin')
+            with open(filename, 'wb') as f:
+                f.write(bytes(64))
+            
+            f = StringIO()
+            with redirect_stdout(f):
+                with pytest.raises(ValueError):
+                    with question_13_file_manager(filename, 'mmap') as view:
+                        records = struct.iter_unpack('<q', view)
+                        raise ValueError("Test exception")
+            assert "File closed:" in f.getvalue()
+            assert sum(1 for _ in records) == 8
+    
+    def test_atomic_write_replaces_only_on_success(self):
+        """Test that a failed atomic write keeps the old contents"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, 'out.txt')
+            with redirect_stdout(StringIO()):
+                with question_13_file_manager(filename, 'w', atomic=True) as file_obj:
+                    file_obj.write("first")
+                    assert not os.path.exists(filename)
+                with pytest.raises(ValueError):
+                    with question_13_file_manager(filename, 'w', atomic=True) as file_obj:
+                        file_obj.write("second")
+                        raise ValueError("Test exception")
+            with open(filename) as f:
+                assert f.read() == "first"
+            assert os.listdir(temp_dir) == ['out.txt']
+
+
 class TestQuestion14ThreadSafeCounter:
     """Test Question 14: Thread-Safe Counter (6 points)"""
     
@@ -235,6 +406,95 @@ class TestQuestion14ThreadSafeCounter:
         assert counter.get_value() == 250
 
 
+class TestShardedCounter:
+    """Test the per-thread-cell counter built on Question 14's API"""
+    
+    def test_same_api_as_lock_counter(self):
+        """Test increment, decrement, add and reset"""
+        for counter in (Question14ThreadSafeCounter(), ShardedCounter()):
+            counter.increment()
+            counter.add(10)
+            counter.decrement()
+            assert counter.get_value() == 10
+            counter.reset()
+            assert counter.get_value() == 0
+            counter.add(-3)
+            assert counter.get_value() == -3
+    
+    def test_many_threads_and_thread_churn(self):
+        """Test totals from concurrent and already finished threads"""
+        counter = ShardedCounter()
+        
+        def worker():
+            for _ in range(1000):
+                counter.increment()
+            counter.add(500)
+        
+        for _ in range(3):
+            threads = [threading.Thread(target=worker) for _ in range(16)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        assert counter.get_value() == 3 * 16 * 1500
+        assert len(counter._cells) <= 17
+
+
+class TestProcessSharedCounter:
+    """Stress the shared-memory counter from several processes"""
+    
+    def test_processes_and_overflow_cell(self):
+        """Test exact totals with more processes than private cells"""
+        counter = ProcessSharedCounter(flush_every=100, max_processes=3)
+        counter.add(5)
+        processes = [
+            multiprocessing.Process(target=_hammer_counter, args=(counter, 1001))
+            for _ in range(6)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            assert process.exitcode == 0
+        
+        assert counter.get_value() == 5 + 6 * (1001 + 7)
+        counter.reset()
+        counter.decrement()
+        assert counter.get_value() == -1
+    
+    def test_process_pool_with_initializer(self):
+        """Test counting from pool workers, including the spawn start method"""
+        for method in ('fork', 'spawn'):
+            context = multiprocessing.get_context(method)
+            counter = ProcessSharedCounter(flush_every=64, context=context)
+            with ProcessPoolExecutor(max_workers=3, mp_context=context,
+                                     initializer=_set_pool_counter, initargs=(counter,)) as pool:
+                submitted = sum(pool.map(_count_in_pool, [500] * 12))
+            assert counter.get_value() == submitted == 6000
+    
+    def test_imports_without_fork_hooks(self):
+        """Test that the module loads where os.register_at_fork is missing (Windows)"""
+        import subprocess
+        import sys
+        # Standard library modules are loaded first, as they look it up themselves
+        code = ("import os, concurrent.futures.process, multiprocessing.util; "
+                "del os.register_at_fork; import questions.advanced_python")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, '-c', code], cwd=root, check=True)
+    
+    def test_counter_is_collected_and_flushes(self):
+        """Test that the exit flush does not keep the counter alive"""
+        import weakref
+        counter = ProcessSharedCounter(flush_every=1000)
+        cells = counter._cells
+        counter.add(7)
+        ref = weakref.ref(counter)
+        del counter
+        assert ref() is None
+        assert cells[ProcessSharedCounter._FIRST_CELL] == 7
+
+
 class TestQuestion15DataProcessor:
     """Test Question 15: Advanced Data Processing (6 points)"""
     
@@ -297,4 +557,41 @@ class TestQuestion15DataProcessor:
         result_items = list(result.items())
         expected_items = list(expected.items())
         
-        assert result_items == expected_items 
\ No newline at end of file
+        assert result_items == expected_items 
+
+
+class TestPeopleStreamProcessor:
+    """Test the streaming group-by engine built on Question 15"""
+    
+    PEOPLE = [
+        {"name": f"P{i}", "age": (i * 7) % 60 + 5, "city": ("NYC", "LA", "Chicago", "Austin")[i % 4]}
+        for i in range(2000)
+    ] + [{"name": "Late", "age": 50, "city": "Boston"}]
+    
+    def test_iterables_match_question_15(self):
+        """Test generators, serial and in a process pool, including ordering"""
+        expected = question_15_data_processor(self.PEOPLE)
+        for workers in (1, 3):
+            result = process_people_stream((p for p in self.PEOPLE), workers=workers, chunk_size=300)
+            assert list(result.items()) == list(expected.items())
+    
+    def test_jsonl_and_csv_files(self):
+        """Test both file formats, with a quoted city spanning two lines"""
+        import csv
+        import json
+        people = self.PEOPLE + [{"name": "Q", "age": 33, "city": "New\nYork, \"NY\""}]
+        expected = question_15_data_processor(people)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            jsonl = os.path.join(temp_dir, 'people.jsonl')
+            with open(jsonl, 'w') as f:
+                f.writelines(json.dumps(person) + "\n" for person in people)
+            table = os.path.join(temp_dir, 'people.csv')
+            with open(table, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=["name", "age", "city"])
+                writer.writeheader()
+                writer.writerows(people)
+            
+            for path in (jsonl, table):
+                for workers in (1, 2):
+                    result = process_people_stream(path, workers=workers, chunk_size=250)
+                    assert list(result.items()) == list(expected.items())
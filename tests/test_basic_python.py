@@ -9,7 +9,12 @@ from questions.basic_python import (
     question_2_find_largest,
     question_3_reverse_string,
     question_4_count_vowels,
-    question_5_fibonacci
+    question_5_fibonacci,
+    count_vowels_file,
+    count_vowels_many,
+    fibonacci_many,
+    reverse_file,
+    summarize_numbers
 )
 
 
@@ -34,6 +39,24 @@ class TestQuestion1SumOfNumbers:
         """Test sum of float numbers"""
         assert question_1_sum_of_numbers([1.5, 2.5, 3.0]) == 7.0
 
+    def test_sum_iterables_and_arrays(self):
+        """Test generators and array.array inputs"""
+        import array
+        assert question_1_sum_of_numbers(x for x in range(101)) == 5050
+        assert question_1_sum_of_numbers(array.array('i', [1, 2, 3])) == 6
+        assert question_1_sum_of_numbers(array.array('d', [1.5, 2.5])) == 4.0
+    
+    def test_sum_buffers_memoryview_cannot_read(self):
+        """Test that ctypes arrays ('<i' buffers) fall back to iteration"""
+        import ctypes
+        values = (ctypes.c_int * 3)(1, 2, 3)
+        assert question_1_sum_of_numbers(values) == 6
+        assert question_2_find_largest(values) == 3
+    
+    def test_sum_exact_mode(self):
+        """Test compensated summation with cancellation"""
+        assert question_1_sum_of_numbers([1e100, 1.0, -1e100], exact=True) == 1.0
+
 
 class TestQuestion2FindLargest:
     """Test Question 2: Find Largest Number (3 points)"""
@@ -56,6 +79,48 @@ class TestQuestion2FindLargest:
         """Test finding largest in single element list"""
         assert question_2_find_largest([42]) == 42
 
+    def test_find_largest_iterable(self):
+        """Test finding largest in a generator, including empty ones"""
+        assert question_2_find_largest(x for x in [4, 11, 7]) == 11
+        assert question_2_find_largest(iter([])) is None
+
+
+class TestSummarizeNumbers:
+    """Test the single-pass reducer shared by Questions 1 and 2"""
+    
+    def test_all_statistics_in_one_pass(self):
+        """Test count, sum, min, max and first argmax from a generator"""
+        stats = summarize_numbers(x for x in [3, 9, -2, 9, 0])
+        assert stats == (5, 19, -2, 9, 1)
+    
+    def test_empty_input(self):
+        """Test that empty input matches question 2's None"""
+        assert summarize_numbers([]).maximum is None
+        assert summarize_numbers([]).count == 0
+    
+    def test_parallel_matches_serial(self):
+        """Test the process-pool path on an array-backed input"""
+        import array
+        values = array.array('q', [(i * 7919) % 1000 for i in range(5000)])
+        serial = summarize_numbers(values, chunk_size=100, workers=1)
+        parallel = summarize_numbers(values, chunk_size=100, workers=3, parallel_threshold=1000)
+        assert parallel == serial
+        assert serial.argmax == list(values).index(max(values))
+    
+    def test_process_pool_is_opt_in(self, monkeypatch):
+        """Test that large arrays stay in-process unless workers > 1 is asked for"""
+        import array
+        from questions import basic_python
+        
+        def no_pool(view, workers):
+            raise AssertionError("started a process pool")
+        
+        monkeypatch.setattr(basic_python, '_reduce_in_processes', no_pool)
+        values = array.array('q', range(5000))
+        assert summarize_numbers(values, parallel_threshold=1000).maximum == 4999
+        assert summarize_numbers(values, workers=None, parallel_threshold=1000).argmax == 4999
+        assert question_2_find_largest(values) == 4999
+
 
 class TestQuestion3ReverseString:
     """Test Question 3: Reverse String (4 points)"""
@@ -82,6 +147,65 @@ class TestQuestion3ReverseString:
         assert question_3_reverse_string("hello world") == "dlrow olleh"
 
 
+class TestReverseEngine:
+    """Test the large-input and grapheme modes of Question 3"""
+    
+    def test_reverse_bytes_and_long_strings(self):
+        """Test byte buffers and a multi-MB string"""
+        assert question_3_reverse_string(bytearray(b"abc")) == b"cba"
+        text = "abcdefghij" * 500_000
+        reversed_text = question_3_reverse_string(text)
+        assert len(reversed_text) == len(text)
+        assert reversed_text[:3] == "jih"
+    
+    def test_grapheme_mode_keeps_clusters(self):
+        """Test that combining marks, flags and ZWJ emoji stay intact"""
+        family = "\U0001F468\u200d\U0001F469\u200d\U0001F467"
+        text = "cafe\u0301 " + family + "\U0001F1EB\U0001F1F7\r\n"
+        assert question_3_reverse_string(text, graphemes=True) == (
+            "\r\n\U0001F1EB\U0001F1F7" + family + " e\u0301fac"
+        )
+        assert question_3_reverse_string("hello", graphemes=True) == "olleh"
+    
+    def test_reverse_file_matches_in_memory(self):
+        """Test block-wise file reversal with blocks smaller than a character"""
+        import os
+        import tempfile
+        text = ("Zürich 🇨🇭 cafe\u0301 " + "\U0001F44B\U0001F3FD" + " naïve\r\n") * 200
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = os.path.join(temp_dir, 'in.txt')
+            target = os.path.join(temp_dir, 'out.txt')
+            with open(source, 'w', encoding='utf-8', newline='') as f:
+                f.write(text)
+            for graphemes in (False, True):
+                for block_size in (1, 7, 4096):
+                    reverse_file(source, target, graphemes=graphemes, block_size=block_size)
+                    with open(target, encoding='utf-8', newline='') as f:
+                        assert f.read() == question_3_reverse_string(text, graphemes=graphemes)
+            reverse_file(source, target, encoding=None, block_size=5)
+            with open(source, 'rb') as f, open(target, 'rb') as g:
+                assert g.read() == question_3_reverse_string(f.read())
+    
+    def test_reverse_file_keeps_flags_across_blocks(self):
+        """Test that runs of regional indicators split across blocks pair up as in memory"""
+        import os
+        import random
+        import tempfile
+        pieces = ['a', '\u0301', '\U0001F1E8', '\U0001F1ED', '\U0001F1FA', '\u200d', '\U0001F44B', '\r\n']
+        rng = random.Random(0)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = os.path.join(temp_dir, 'in.txt')
+            target = os.path.join(temp_dir, 'out.txt')
+            for _ in range(300):
+                text = ''.join(rng.choice(pieces) for _ in range(rng.randrange(1, 16)))
+                with open(source, 'w', encoding='utf-8', newline='') as f:
+                    f.write(text)
+                for block_size in (3, 4, 5):
+                    reverse_file(source, target, graphemes=True, block_size=block_size)
+                    with open(target, encoding='utf-8', newline='') as f:
+                        assert f.read() == question_3_reverse_string(text, graphemes=True)
+
+
 class TestQuestion4CountVowels:
     """Test Question 4: Count Vowels (5 points)"""
     
@@ -110,6 +234,58 @@ class TestQuestion4CountVowels:
         assert question_4_count_vowels("programming") == 3
 
 
+class TestVowelCountingBatch:
+    """Test batch and file vowel counting built on Question 4"""
+    
+    def test_unicode_text(self):
+        """Test that only ASCII vowels count, whatever else is in the text"""
+        assert question_4_count_vowels("Éléphant über İstanbul") == 4
+        assert question_4_count_vowels("naïve café \ud800") == 3
+    
+    def test_many_matches_single_calls(self):
+        """Test the batch API on a generator of strings"""
+        texts = ["Hello World", "PYTHON", "", "Ünïcödé"]
+        assert count_vowels_many(t for t in texts) == [question_4_count_vowels(t) for t in texts]
+    
+    def test_file_matches_single_call(self):
+        """Test serial, parallel and decoded file counting"""
+        import os
+        import tempfile
+        text = "Ärger im Büro, aber OK.\n" * 3000 + "xyz"
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'corpus.txt')
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write(text)
+            expected = question_4_count_vowels(text)
+            assert count_vowels_file(path, workers=1, chunk_size=1000) == expected
+            assert count_vowels_file(path, workers=3, chunk_size=1000, parallel_threshold=0) == expected
+            
+            utf16 = os.path.join(temp_dir, 'corpus16.txt')
+            with open(utf16, 'w', encoding='utf-16', newline='') as f:
+                f.write(text)
+            assert count_vowels_file(utf16, encoding='utf-16', chunk_size=1000) == expected
+    
+    def test_file_pool_is_opt_in(self, monkeypatch):
+        """Test that files stay in-process by default and empty files never split"""
+        import os
+        import tempfile
+        from questions import basic_python
+        
+        def no_pool(*args, **kwargs):
+            raise AssertionError("started a process pool")
+        
+        monkeypatch.setattr(basic_python, 'ProcessPoolExecutor', no_pool)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'corpus.txt')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("aeiou" * 1000)
+            assert count_vowels_file(path, parallel_threshold=0) == 5000
+            assert count_vowels_file(path, workers=None, parallel_threshold=0) == 5000
+            empty = os.path.join(temp_dir, 'empty.txt')
+            open(empty, 'w').close()
+            assert count_vowels_file(empty, workers=3, parallel_threshold=0) == 0
+
+
 class TestQuestion5Fibonacci:
     """Test Question 5: Fibonacci Sequence (5 points)"""
     
@@ -135,4 +311,25 @@ class TestQuestion5Fibonacci:
     def test_fibonacci_sequence_property(self):
         """Test fibonacci sequence property: F(n) = F(n-1) + F(n-2)"""
         for n in range(2, 10):
-            assert question_5_fibonacci(n) == question_5_fibonacci(n-1) + question_5_fibonacci(n-2) 
\ No newline at end of file
+            assert question_5_fibonacci(n) == question_5_fibonacci(n-1) + question_5_fibonacci(n-2) 
+
+
+class TestFibonacciEngine:
+    """Test the fast-doubling engine behind Question 5"""
+    
+    def test_large_index_matches_linear_loop(self):
+        """Test exact big-int results against the plain recurrence"""
+        a, b = 0, 1
+        for _ in range(5000):
+            a, b = b, a + b
+        assert question_5_fibonacci(5000) == a
+    
+    def test_fibonacci_many_preserves_input_order(self):
+        """Test batch results line up with unsorted, repeated indices"""
+        indices = [300, 0, 10, 300, 1, 150]
+        assert fibonacci_many(indices) == [question_5_fibonacci(i) for i in indices]
+    
+    def test_negative_index_rejected(self):
+        """Test that negative positions raise ValueError"""
+        with pytest.raises(ValueError):
+            question_5_fibonacci(-1)
@@ -9,10 +9,14 @@ import os
 import tempfile
 from questions.intermediate_python import (
     Question6BankAccount,
+    AccountLedger,
     question_7_safe_divide,
     question_8_word_frequency,
     question_9_file_operations,
-    question_10_list_manipulation
+    question_10_list_manipulation,
+    safe_divide_many,
+    word_frequency_stream,
+    write_json_atomic
 )
 
 
@@ -58,6 +62,133 @@ class TestQuestion6BankAccount:
         assert account.get_balance() == 0
 
 
+class TestAccountLedger:
+    """Test the array-backed ledger store built on Question 6"""
+    
+    def test_per_call_semantics_match_class(self):
+        """Test deposit, withdraw and get_balance against the per-object class"""
+        account = Question6BankAccount("12345", 100)
+        ledger = AccountLedger()
+        ledger.open_account("12345", 100)
+        for amount in (30, 150, 70):
+            assert ledger.withdraw("12345", amount) == account.withdraw(amount)
+        account.deposit(25.5)
+        ledger.deposit("12345", 25.5)
+        assert ledger.get_balance("12345") == account.get_balance() == 25.5
+        with pytest.raises(ValueError):
+            ledger.deposit("12345", 0)
+        assert ledger.history("12345") == [('open', 100), ('withdraw', 30), ('withdraw', 70), ('deposit', 25.5)]
+    
+    def test_batch_validates_and_applies_in_order(self):
+        """Test rejected amounts and overdrafts inside a batch"""
+        ledger = AccountLedger()
+        ledger.open_account("a", 10)
+        ledger.open_account("b")
+        results = ledger.apply_batch([
+            ("a", "withdraw", 15), ("a", "deposit", 5), ("a", "withdraw", 15),
+            ("b", "deposit", -1), ("b", "deposit", 2)
+        ])
+        assert results.tolist() == [0, 1, 1, 0, 1]
+        assert (ledger.get_balance("a"), ledger.get_balance("b")) == (0, 2)
+        with pytest.raises(KeyError):
+            ledger.apply_batch([("a", "deposit", 1), ("missing", "deposit", 1)])
+        assert ledger.get_balance("a") == 0
+        assert ledger.history("a") == [('open', 10), ('deposit', 5), ('withdraw', 15)]
+    
+    def test_values_stay_exact(self):
+        """Test that balances and amounts come back as the class would hold them"""
+        big = 2**53 + 1
+        ledger = AccountLedger()
+        ledger.open_account("int", 100)
+        ledger.open_account("big", big)
+        ledger.open_account("huge")
+        ledger.apply_batch([("int", "deposit", 50), ("big", "deposit", 2), ("huge", "deposit", 2**70)])
+        ledger.withdraw("huge", 0.5)
+        balance = ledger.get_balance("int")
+        assert balance == 150 and type(balance) is int
+        assert ledger.get_balance("big") == big + 2
+        assert ledger.get_balance("huge") == 2**70 - 0.5
+        ledger.apply_batch([("big", "deposit", 2**64), ("big", "withdraw", 2**64)])
+        assert ledger.get_balance("big") == big + 2
+        assert ledger.history("huge") == [('open', 0), ('deposit', 2**70), ('withdraw', 0.5)]
+    
+    def test_failed_batch_leaves_nothing_behind(self):
+        """Test that an error mid-batch rolls back compact and exact balances"""
+        ledger = AccountLedger()
+        ledger.open_account("a", 10)
+        ledger.open_account("b", 2**70)
+        bad_entries = (("missing", "deposit", 1), ("a", "transfer", 1), ("a", "deposit", "1"),
+                       None, ("a", "deposit"))
+        for bad in bad_entries:
+            with pytest.raises((KeyError, TypeError, ValueError)):
+                ledger.apply_batch([
+                    ("a", "deposit", 5), ("a", "deposit", 0.5), ("b", "withdraw", 1),
+                    ("a", "withdraw", 5.5), ("a", "deposit", 3), bad
+                ])
+            assert (ledger.get_balance("a"), ledger.get_balance("b")) == (10, 2**70)
+            assert type(ledger.get_balance("a")) is int
+        assert ledger.history("a") == [('open', 10)]
+        ledger.deposit("a", 1)
+        assert ledger.history("a") == [('open', 10), ('deposit', 1)]
+    
+    def test_history_matches_the_ledger_order(self):
+        """Test per-account history while the ledger keeps growing between calls"""
+        import random
+        rng = random.Random(3)
+        ledger = AccountLedger()
+        expected = {number: [('open', 1000)] for number in range(50)}
+        for number in expected:
+            ledger.open_account(number, 1000)
+        for round_size in (1, 7, 300, 2, 40, 1000, 1):
+            batch = [(rng.randrange(50), rng.choice(("deposit", "withdraw")), rng.randint(1, 9))
+                     for _ in range(round_size)]
+            for (number, kind, amount), applied in zip(batch, ledger.apply_batch(batch)):
+                if applied:
+                    expected[number].append((kind, amount))
+            number = rng.randrange(50)
+            assert ledger.history(number) == expected[number]
+        assert all(ledger.history(number) == expected[number] for number in expected)
+    
+    def test_thread_safe_batches(self):
+        """Test that concurrent batches on shared accounts lose no updates"""
+        import threading
+        ledger = AccountLedger(thread_safe=True, stripes=4)
+        for number in range(16):
+            ledger.open_account(number)
+        batch = [(number, "deposit", 1) for number in range(16)] * 50
+        threads = [threading.Thread(target=ledger.apply_batch, args=(batch,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert all(ledger.get_balance(number) == 400 for number in range(16))
+        with pytest.raises(TypeError):
+            ledger.apply_batch([(0, "deposit", 1), (1, "deposit", None)])
+        assert (ledger.get_balance(0), len(ledger.history(0))) == (400, 401)
+    
+    def test_reads_while_a_balance_leaves_the_side_table(self):
+        """Test that get_balance never misses a balance a writer is moving"""
+        import array
+        import threading
+        ledger = AccountLedger(thread_safe=True)
+        ledger.open_account(0, 2 ** 64)
+        writer = threading.Thread(target=ledger.withdraw, args=(0, 2 ** 64))
+        
+        class Balances(array.array):
+            def __getitem__(self, index):
+                balance = super().__getitem__(index)
+                if writer.ident is None:
+                    # The writer gets in between the reader's two lookups
+                    writer.start()
+                    writer.join(0.2)
+                return balance
+        
+        ledger._balances = Balances('q', ledger._balances)
+        assert ledger.get_balance(0) == 2 ** 64
+        writer.join()
+        assert ledger.get_balance(0) == 0
+
+
 class TestQuestion7SafeDivide:
     """Test Question 7: Safe Division with Error Handling (5 points)"""
     
@@ -83,6 +214,24 @@ class TestQuestion7SafeDivide:
         assert question_7_safe_divide(-10, 2) == -5.0
         assert question_7_safe_divide(10, -2) == -5.0
         assert question_7_safe_divide(-10, -2) == 5.0
+    
+    def test_safe_divide_many_lists(self):
+        """Test the batch variant against the scalar function"""
+        from decimal import Decimal
+        numerators = [10, 7, 0, "10", 10, 1.5, Decimal(1), True]
+        denominators = [2, 2, 0, 2, "2", 0.0, Decimal(0), 2]
+        assert safe_divide_many(numerators, denominators) == [
+            question_7_safe_divide(a, b) for a, b in zip(numerators, denominators)
+        ]
+        with pytest.raises(ValueError):
+            safe_divide_many([1, 2], [1])
+    
+    def test_safe_divide_many_arrays(self):
+        """Test the result array and validity mask for array inputs"""
+        import array
+        result, valid = safe_divide_many(array.array('i', [10, 7, 3]), array.array('d', [2, 0, -2]))
+        assert list(valid) == [1, 0, 1]
+        assert [result[0], result[2]] == [5.0, -1.5]
 
 
 class TestQuestion8WordFrequency:
@@ -118,6 +267,30 @@ class TestQuestion8WordFrequency:
         assert result == expected
 
 
+class TestWordFrequencyStream:
+    """Test the streaming word-frequency engine built on Question 8"""
+    
+    def test_words_split_across_pieces(self):
+        """Test that words cut at chunk boundaries are counted once"""
+        text = "The cat, the HAT! And the bat... " * 50
+        pieces = [text[i:i + 7] for i in range(0, len(text), 7)]
+        assert word_frequency_stream(pieces, chunk_size=16) == question_8_word_frequency(text)
+    
+    def test_file_in_process_pool(self):
+        """Test a file read in small chunks and counted by several workers"""
+        text = "alpha beta, Beta gamma\ngamma GAMMA delta!\n" * 500
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'corpus.txt')
+            with open(path, 'w') as f:
+                f.write(text)
+            assert word_frequency_stream(path, workers=3, chunk_size=100) == question_8_word_frequency(text)
+    
+    def test_top_k(self):
+        """Test top-k selection, most frequent first"""
+        result = word_frequency_stream(["b a c b a b d"], top_k=2)
+        assert result == [('b', 3), ('a', 2)]
+
+
 class TestQuestion9FileOperations:
     """Test Question 9: JSON File Operations (5 points)"""
     
@@ -159,6 +332,43 @@ class TestQuestion9FileOperations:
         # Use invalid filename that should cause an error
         result = question_9_file_operations("/invalid/path/file.json", data)
         assert result is None
+    
+    def test_atomic_write_keeps_old_file_on_error(self):
+        """Test that a failed write leaves the previous contents and no temp file"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, 'data.json')
+            assert question_9_file_operations(filename, {"v": 1}) == {"v": 1}
+            assert question_9_file_operations(filename, {"v": float('nan')}) is None
+            assert question_9_file_operations(filename, {"v": object()}) is None
+            with open(filename) as f:
+                assert json.load(f) == {"v": 1}
+            assert os.listdir(temp_dir) == ['data.json']
+    
+    def test_checksum_mode_and_streamed_blocks(self):
+        """Test checksum verification and that small encoder blocks parse back the same"""
+        import hashlib
+        data = {"name": "Zoë", "values": list(range(5000)), "nested": {"none": None, "big": 2 ** 70}}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, 'data.json')
+            assert question_9_file_operations(filename, data, verify='checksum') is data
+            for verify in (False, True):
+                digest = write_json_atomic(filename, data, verify=verify, buffer_size=100)
+                with open(filename, 'rb') as f:
+                    content = f.read()
+                assert hashlib.sha256(content).hexdigest() == digest
+                assert json.loads(content) == data
+    
+    def test_rejects_what_json_rejects(self):
+        """Test that values the json module cannot encode fail and leave no file"""
+        import enum
+        import uuid
+        Color = enum.Enum('Color', 'RED')
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, 'data.json')
+            for value in (uuid.uuid4(), Color.RED, float('inf')):
+                with pytest.raises((TypeError, ValueError)):
+                    write_json_atomic(filename, {"v": value})
+            assert os.listdir(temp_dir) == []
 
 
 class TestQuestion10ListManipulation:
@@ -198,4 +408,15 @@ class TestQuestion10ListManipulation:
         """Test that order is preserved before sorting"""
         result = question_10_list_manipulation([8, 2, 4, 6, 2, 8])
         expected = [2, 4, 6, 8]
-        assert result == expected 
\ No newline at end of file
+        assert result == expected 
+    
+    def test_list_manipulation_arrays_and_iterables(self):
+        """Test array.array input, generators and the compact array result"""
+        import array
+        values = array.array('i', [9, 4, -2, 4, 7, 0, -2])
+        result = question_10_list_manipulation(values, as_array=True)
+        assert isinstance(result, array.array) and result.typecode == 'i'
+        assert result.tolist() == [-2, 0, 4]
+        assert question_10_list_manipulation(values) == [-2, 0, 4]
+        assert question_10_list_manipulation(n for n in [6, 3, 6, 2]) == [2, 6]
+        assert question_10_list_manipulation([8, 2, 8], as_array=True) == array.array('q', [2, 8])
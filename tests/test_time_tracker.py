@@ -0,0 +1,684 @@
+"""
+Test cases for the time tracking utility (time_tracker.py).
+These are not graded; they cover the tracker's on-disk storage.
+"""
+
+import pytest
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import multiprocessing
+from io import StringIO
+from contextlib import redirect_stdout
+import time_tracker
+from time_tracker import (
+    AssessmentTimeTracker,
+    ActiveSessionState,
+    BinarySessionLog,
+    EventShipper,
+    QuestionFileWatcher,
+    TimeLogStore,
+    build_rollup
+)
+
+
+TIME_TRACKER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'time_tracker.py')
+ANALYTICS_DIR = os.path.join(os.path.dirname(TIME_TRACKER), 'analytics')
+_spawn_compactor = AssessmentTimeTracker._compact_in_background
+
+
+@pytest.fixture(autouse=True)
+def _compact_in_foreground(monkeypatch):
+    """Compact inline when the journal is due, so no detached compactor outlives a test's temp directory"""
+    monkeypatch.setattr(AssessmentTimeTracker, '_compact_in_background', AssessmentTimeTracker.compact_log)
+
+
+def _wait_for_compactor(log_file, timeout=30):
+    """Wait until no background compactor is registered in the log's lock file"""
+    store = TimeLogStore(log_file)
+    deadline = time.time() + timeout
+    while True:
+        with store.locked():
+            if not store._compactor_seen():
+                return
+        assert time.time() < deadline, "background compactor did not finish"
+        time.sleep(0.01)
+
+
+def _hammer_tracker(log_file, worker_id, rounds):
+    """Worker: record sessions and submissions against a shared log"""
+    tracker = AssessmentTimeTracker(student_id='stress', log_file=log_file)
+    # Private active-session state so every start/end pair records one session
+    tracker.state = ActiveSessionState(f"{log_file}.{worker_id}.state")
+    with redirect_stdout(StringIO()):
+        for _ in range(rounds):
+            tracker.start_session('basic_python')
+            tracker.end_session()
+            tracker.log_submission()
+
+
+def _end_shared_session(log_file):
+    """Worker: try to end whatever session is active"""
+    with redirect_stdout(StringIO()):
+        AssessmentTimeTracker(student_id='stress', log_file=log_file).end_session()
+
+
+class TestTimeLogStorage:
+    """Test the journal, rollup and snapshot files behind the tracker"""
+
+    def test_events_survive_reload(self):
+        """Test that a new tracker replays what an earlier one recorded"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = os.path.join(temp_dir, 'log.json')
+            with redirect_stdout(StringIO()):
+                tracker = AssessmentTimeTracker(student_id='s1', log_file=log_file)
+                tracker.start_session('advanced_python')
+                tracker.end_session()
+
+            reloaded = AssessmentTimeTracker(student_id='s1', log_file=log_file)
+            assert len(reloaded.data['sessions']) == 1
+            assert reloaded.data['sessions'][0]['category'] == 'advanced_python'
+
+    def test_legacy_log_is_imported(self):
+        """Test that a log written before the journal existed still loads"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = os.path.join(temp_dir, 'log.json')
+            tracker = AssessmentTimeTracker(student_id='s1', log_file=log_file)
+            legacy = tracker.data
+            legacy['category_time']['basic_python'] = 12.5
+            legacy['total_active_time'] = 12.5
+            legacy['submission_count'] = 3
+            with open(log_file, 'w') as f:
+                json.dump(legacy, indent=2, fp=f)
+
+            with redirect_stdout(StringIO()):
+                AssessmentTimeTracker(log_file=log_file).log_submission()
+
+            data = AssessmentTimeTracker(log_file=log_file).data
+            assert data['submission_count'] == 4
+            assert data['category_time']['basic_python'] == 12.5
+
+    def test_end_without_start_across_trackers(self):
+        """Test that a session started by one tracker is ended by another"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = os.path.join(temp_dir, 'log.json')
+            with redirect_stdout(StringIO()):
+                AssessmentTimeTracker(log_file=log_file).start_session('backend_development')
+                f = StringIO()
+                with redirect_stdout(f):
+                    AssessmentTimeTracker(log_file=log_file).end_session()
+
+            assert "Session ended" in f.getvalue()
+            assert AssessmentTimeTracker(log_file=log_file).data['sessions'][0]['category'] == 'backend_development'
+
+    def test_rollups_match_full_rebuild(self):
+        """Test that incremental rollups equal a rebuild from the session list"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = os.path.join(temp_dir, 'log.json')
+            tracker = AssessmentTimeTracker(student_id='s1', log_file=log_file)
+            with redirect_stdout(StringIO()):
+                tracker.start_session('basic_python', question=3)
+                tracker.start_session(question=12)
+                tracker.end_session()
+
+            assert tracker.get_question_breakdown().keys() == {'Q3', 'Q12'}
+            incremental = tracker._refresh()
+            rebuilt = build_rollup(tracker.data, incremental['journal_seq'], incremental['snapshot_seq'])
+            assert incremental == rebuilt
+
+    def test_first_event_writes_snapshot_with_start(self):
+        """Test that the assignment start is on disk from the first event and survives compaction"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = os.path.join(temp_dir, 'log.json')
+            with redirect_stdout(StringIO()):
+                AssessmentTimeTracker(student_id='s1', log_file=log_file).start_session('basic_python')
+            with open(log_file) as f:
+                started = json.load(f)['assignment_start']
+
+            time.sleep(0.01)
+            tracker = AssessmentTimeTracker(student_id='s1', log_file=log_file)
+            with redirect_stdout(StringIO()):
+                tracker.log_submission()
+            tracker.compact_log()
+            with open(log_file) as f:
+                snapshot = json.load(f)
+            assert snapshot['assignment_start'] == started
+            assert snapshot['submission_count'] == 1
+
+    def test_background_compaction_once_the_journal_grows(self, monkeypatch):
+        """Test that a detached compactor starts only when the journal is due, and folds it all"""
+        monkeypatch.setattr(AssessmentTimeTracker, '_compact_in_background', _spawn_compactor)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = os.path.join(temp_dir, 'log.json')
+            tracker = AssessmentTimeTracker(student_id='s1', log_file=log_file)
+            tracker.store.compact_after = 4
+            earlier = list(time_tracker._compactors)
+            with redirect_stdout(StringIO()):
+                tracker.start_session('intermediate_python', question=7)
+                tracker.end_session()
+                tracker.log_submission()
+                assert [process for process in time_tracker._compactors if process not in earlier] == []
+                tracker.log_submission()
+            started = [process for process in time_tracker._compactors if process not in earlier]
+            assert len(started) == 1
+            assert started[0].wait(30) == 0
+
+            with open(log_file) as f:
+                snapshot = json.load(f)
+            assert [s['question'] for s in snapshot['sessions']] == [7]
+            assert snapshot['submission_count'] == 2
+            assert snapshot['journal_seq'] == tracker.journal_seq == 4
+            assert os.path.getsize(tracker.store.journal_file) == 0
+
+    def test_compactions_are_amortized_over_the_history(self, monkeypatch):
+        """Test that the journal must grow with the history before it is folded again"""
+        compactions = []
+        monkeypatch.setattr(AssessmentTimeTracker, '_compact_in_background',
+                            lambda tracker: compactions.append(tracker.journal_seq) or tracker.compact_log())
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracker = AssessmentTimeTracker(student_id='s1', log_file=os.path.join(temp_dir, 'log.json'))
+            tracker.store.compact_after = 8
+            for _ in range(200):
+                tracker.record_session('basic_python', 1_700_000_000, 1_700_000_060)
+            # Each fold waits for as many new events as there are sessions
+            assert compactions == [8, 16, 32, 64, 128]
+            assert AssessmentTimeTracker(log_file=tracker.log_file).data['total_active_time'] == 200
+
+    def test_fold_journal_keeps_concurrent_events(self):
+        """Test that events appended while a fold is under way are not lost"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = os.path.join(temp_dir, 'log.json')
+            tracker = AssessmentTimeTracker(student_id='s1', log_file=log_file)
+            tracker._compact_in_background = lambda: None
+            store = tracker.store
+            tracker.record_session('basic_python', 1_700_000_000, 1_700_000_600)
+            load = store._load_consistent
+
+            def load_then_record(student_id):
+                # Another writer gets in between loading and swapping the snapshot
+                loaded = load(student_id)
+                if len(tracker.data['sessions']) == 1:
+                    tracker.record_session('advanced_python', 1_700_001_000, 1_700_001_300)
+                return loaded
+
+            store._load_consistent = load_then_record
+            store.fold_journal('s1')
+
+            with open(log_file) as f:
+                snapshot = json.load(f)
+            assert [s['category'] for s in snapshot['sessions']] == ['basic_python', 'advanced_python']
+            assert AssessmentTimeTracker(log_file=log_file).data['total_active_time'] == 15.0
+
+    def test_start_end_and_submit_leave_the_snapshot_alone(self):
+        """Test that recording sessions and submissions never rewrites the snapshot inline"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = os.path.join(temp_dir, 'log.json')
+            tracker = AssessmentTimeTracker(student_id='s1', log_file=log_file)
+            with redirect_stdout(StringIO()):
+                tracker.start_session('basic_python')
+                initial = os.stat(log_file)
+                for _ in range(60):
+                    tracker.start_session('basic_python')
+                    tracker.end_session()
+                tracker.log_submission()
+
+            after = os.stat(log_file)
+            assert (after.st_ino, after.st_mtime_ns) == (initial.st_ino, initial.st_mtime_ns)
+            # The first session is ended by the second start
+            data = AssessmentTimeTracker(log_file=log_file).data
+            assert (len(data['sessions']), data['submission_count']) == (61, 1)
+
+    def test_journal_only_log_starts_at_first_event(self):
+        """Test that a log with no snapshot takes its start from the first journal event"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = os.path.join(temp_dir, 'log.json')
+            with open(os.path.join(temp_dir, 'log.jsonl'), 'w') as f:
+                f.write(json.dumps({'seq': 1, 'type': 'submission', 'time': '2024-03-01T09:30:00'}) + '\n')
+
+            data = AssessmentTimeTracker(log_file=log_file).data
+            assert data['assignment_start'] == '2024-03-01T09:30:00'
+            assert data['submission_count'] == 1
+
+    def test_question_outside_category_is_rejected(self):
+        """Test that a question number must belong to the session's category"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracker = AssessmentTimeTracker(log_file=os.path.join(temp_dir, 'log.json'))
+            with pytest.raises(ValueError):
+                tracker.start_session('basic_python', question=9)
+
+
+
+class TestGlobalTracker:
+    """Test the lazily created module-level tracker and its configuration"""
+
+    def test_import_creates_no_files(self):
+        """Test that importing the module does no I/O in the working directory"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            subprocess.run(
+                [sys.executable, '-c', 'import time_tracker; time_tracker.configure()'],
+                cwd=temp_dir, check=True,
+                env={**os.environ, 'PYTHONPATH': os.path.dirname(TIME_TRACKER)}
+            )
+            assert os.listdir(temp_dir) == []
+
+    def test_get_tracker_is_lazy_and_follows_configure(self, monkeypatch):
+        """Test that configure() and ASSESSMENT_TIME_LOG pick the log of the next tracker"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            env_log = os.path.join(temp_dir, 'env.json')
+            monkeypatch.setenv('ASSESSMENT_TIME_LOG', env_log)
+            try:
+                time_tracker.configure(student_id='s1')
+                assert time_tracker._tracker is None
+                tracker = time_tracker.get_tracker()
+                assert time_tracker.get_tracker() is tracker
+                assert time_tracker.tracker is tracker
+                assert str(tracker.log_file) == env_log
+                assert tracker._data is None
+
+                explicit_log = os.path.join(temp_dir, 'explicit.json')
+                time_tracker.configure(log_file=explicit_log, student_id='s1')
+                assert str(time_tracker.get_tracker().log_file) == explicit_log
+                assert os.listdir(temp_dir) == []
+            finally:
+                time_tracker.configure()
+
+    def test_log_file_option_and_rollup_only_summary(self, monkeypatch):
+        """Test --log-file on the command line, and that summary reads the rollup, not the log"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = os.path.join(temp_dir, 'elsewhere', '.assessment_time_log.json')
+            os.mkdir(os.path.dirname(log_file))
+            for command in ('start_basic', 'end'):
+                subprocess.run([sys.executable, TIME_TRACKER, '--log-file', log_file, command],
+                               cwd=temp_dir, check=True, stdout=subprocess.DEVNULL)
+            _wait_for_compactor(log_file)
+            assert os.listdir(temp_dir) == ['elsewhere']
+
+            opened = []
+            monkeypatch.setattr(time_tracker, 'open', lambda path, *args, **kwargs: (
+                opened.append(os.path.basename(path)) or open(path, *args, **kwargs)
+            ), raising=False)
+            monkeypatch.chdir(os.path.dirname(log_file))
+            try:
+                time_tracker.configure()
+                output = StringIO()
+                with redirect_stdout(output):
+                    time_tracker.show_summary()
+                assert "Sessions: 1" in output.getvalue()
+                assert '.assessment_time_log.rollup.json' in opened
+                assert '.assessment_time_log.json' not in opened
+                assert time_tracker.get_tracker()._data is None
+            finally:
+                time_tracker.configure()
+
+
+class TestBinarySessionLog:
+    """Test the compact binary session store"""
+
+    def test_window_totals_and_json_round_trip(self):
+        """Test time-window totals and conversion back to the JSON layout"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = os.path.join(temp_dir, 'log.json')
+            tracker = AssessmentTimeTracker(log_file=log_file, binary_sessions=True)
+            day = 86400
+            start = 1_700_000_000
+            with redirect_stdout(StringIO()):
+                for offset in range(5):
+                    tracker.record_session('basic_python', start + offset * day, start + offset * day + 600)
+                # Recorded late but started earlier: the store must stay sorted
+                tracker.record_session('backend_development', start + 2.5 * day, start + 2.5 * day + 120, question=18)
+
+            assert tracker.get_window_summary(start + day, start + 3 * day) == {
+                'basic_python': 20.0, 'backend_development': 2.0
+            }
+            plain = AssessmentTimeTracker(log_file=log_file)
+            assert plain.get_window_summary(start + day, start + 3 * day) == tracker.get_window_summary(start + day, start + 3 * day)
+
+            converted = BinarySessionLog.from_log_data(tracker.data, os.path.join(temp_dir, 'copy.bin'))
+            restored = converted.to_log_data(tracker.data)
+            assert len(converted) == 6
+            assert restored['category_time']['basic_python'] == 50.0
+            assert restored['sessions'][3]['question'] == 18
+
+    def test_unknown_category_is_rejected_before_anything_is_written(self):
+        """Test that a category without a binary id records nothing and leaves no active session"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = os.path.join(temp_dir, 'log.json')
+            tracker = AssessmentTimeTracker(log_file=log_file, binary_sessions=True)
+            with pytest.raises(ValueError):
+                tracker.start_session('code_review')
+            with pytest.raises(ValueError):
+                tracker.record_session('code_review', 1_700_000_000, 1_700_000_600)
+            output = StringIO()
+            with redirect_stdout(output):
+                tracker.end_session()
+            assert "No active session" in output.getvalue()
+            assert AssessmentTimeTracker(log_file=log_file).data['sessions'] == []
+            assert len(tracker.binary_log) == 0
+
+
+class TestQuestionFileWatcher:
+    """Test sessions inferred from edits to the question files"""
+
+    def test_idle_gap_and_category_change_split_sessions(self):
+        """Test that edits group into sessions split by idle gaps and categories"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracker = AssessmentTimeTracker(log_file=os.path.join(temp_dir, 'log.json'))
+            watcher = QuestionFileWatcher(tracker, temp_dir, idle_timeout=300)
+            start = 1_700_000_000
+            for offset in (0, 60, 120):
+                watcher.observe('basic_python', start + offset)
+            watcher.observe('basic_python', start + 1000)      # idle gap
+            watcher.observe('basic_python', start + 1030)
+            watcher.observe('advanced_python', start + 1090)   # category change
+            watcher.observe('advanced_python', start + 1150)
+            watcher._close_session()
+
+            sessions = tracker.data['sessions']
+            assert [(s['category'], s['duration_minutes']) for s in sessions] == [
+                ('basic_python', 2.0), ('basic_python', 0.5), ('advanced_python', 1.0)
+            ]
+            assert all(s['source'] == 'watcher' for s in sessions)
+
+    def test_polling_fallback_records_edits(self):
+        """Test the stat-polling source end to end"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracker = AssessmentTimeTracker(log_file=os.path.join(temp_dir, 'log.json'))
+            question_file = os.path.join(temp_dir, 'intermediate_python.py')
+            open(question_file, 'w').close()
+            watcher = QuestionFileWatcher(tracker, temp_dir, idle_timeout=3600, debounce=0.01,
+                                          poll_interval=0.01, use_inotify=False)
+            watcher.start()
+            edited = int(time.time()) - 100
+            for mtime in (edited, edited + 90):
+                time.sleep(0.1)
+                os.utime(question_file, (mtime, mtime))
+            time.sleep(0.1)
+            watcher.stop()
+
+            sessions = tracker.data['sessions']
+            assert len(sessions) == 1
+            assert sessions[0]['category'] == 'intermediate_python'
+            assert sessions[0]['duration_minutes'] == 1.5
+
+
+
+class TestCollectorShipping:
+    """Test shipping events to the lab collector (analytics/tracker_collector.py)"""
+
+    def test_spooled_events_reach_collector_once_it_is_up(self):
+        """Test that events recorded while the collector is down arrive later"""
+        sys.path.insert(0, ANALYTICS_DIR)
+        from tracker_collector import make_server
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            server = make_server('127.0.0.1', 0, os.path.join(temp_dir, 'collector.db'))
+            url = f"http://127.0.0.1:{server.server_address[1]}"
+            tracker = AssessmentTimeTracker(student_id='lab01', log_file=os.path.join(temp_dir, 'log.json'),
+                                            collector_url=url)
+            tracker.shipper.timeout = 0.2
+            with redirect_stdout(StringIO()):
+                # Nothing is listening yet: the event must stay in the spool
+                tracker.record_session('basic_python', 1_700_000_000, 1_700_000_600)
+                tracker.shipper.close()
+
+                threading.Thread(target=server.serve_forever, daemon=True).start()
+                try:
+                    tracker.log_submission()
+                    tracker.shipper.close()
+                    assert tracker.shipper.flush()
+                    totals = server.RequestHandlerClass.store.totals()
+                finally:
+                    server.shutdown()
+                    server.server_close()
+
+            assert totals['submissions'] == 1
+            assert totals['categories']['basic_python'] == {'minutes': 10.0, 'sessions': 1, 'students': 1}
+
+
+    def test_each_process_sends_its_own_batches(self):
+        """Test that another process's fresh batch is left alone and an abandoned one adopted"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            spool = os.path.join(temp_dir, 'log.spool')
+            shipper = EventShipper('http://127.0.0.1:9', spool)
+            sent = []
+            shipper._post = lambda events: sent.extend(event['seq'] for event in events) or True
+            for name, seq, age in (('log.spool.1.1.batch', 1, 0), ('log.spool.2.1.batch', 2, 3600)):
+                with open(os.path.join(temp_dir, name), 'w') as f:
+                    f.write(json.dumps({'seq': seq}) + '\n')
+                os.utime(os.path.join(temp_dir, name), (time.time() - age, time.time() - age))
+            with open(spool, 'w') as f:
+                f.write(json.dumps({'seq': 3}) + '\n')
+
+            assert shipper.flush()
+            assert sorted(sent) == [2, 3]
+            assert sorted(os.listdir(temp_dir)) == ['log.spool.1.1.batch', 'log.spool.lock']
+
+    def test_spool_is_claimed_while_nobody_has_it_open(self, monkeypatch):
+        """Test that claims rename the spool only while it is closed and lose no concurrent events"""
+        if not os.path.isdir('/proc/self/fd'):
+            pytest.skip('needs /proc to list open files')
+        with tempfile.TemporaryDirectory() as temp_dir:
+            spool = os.path.realpath(os.path.join(temp_dir, 'log.spool'))
+            shipper = EventShipper('http://127.0.0.1:9', spool)
+            sent = []
+            shipper._post = lambda events: sent.extend(event['seq'] for event in events) or True
+            real_replace = os.replace
+
+            def replace(source, target):
+                if os.fspath(source) == spool:
+                    # Windows cannot rename a file that is open
+                    open_files = {os.path.realpath(f'/proc/self/fd/{fd}') for fd in os.listdir('/proc/self/fd')}
+                    assert spool not in open_files
+                real_replace(source, target)
+
+            def ship(start):
+                for seq in range(start, start + 200):
+                    shipper.ship({'seq': seq})
+
+            monkeypatch.setattr(os, 'replace', replace)
+            shippers = [threading.Thread(target=ship, args=(start,)) for start in (0, 200)]
+            for thread in shippers:
+                thread.start()
+            while any(thread.is_alive() for thread in shippers):
+                assert shipper.flush()
+            for thread in shippers:
+                thread.join()
+            shipper.close()
+            assert shipper.flush()
+
+            # Concurrent flushes may both send a batch; the collector drops duplicates
+            assert set(sent) == set(range(400))
+
+    def test_malformed_events_do_not_stop_the_writer(self):
+        """Test that unbindable or out-of-range events are dropped and ingestion carries on"""
+        sys.path.insert(0, ANALYTICS_DIR)
+        from tracker_collector import CollectorStore
+
+        def session_end(seq, **fields):
+            return {'student_id': 'lab01', 'host': 'pc1', 'seq': seq, 'type': 'session_end', 'minutes': 10.0,
+                    'session': {'category': 'basic_python', 'end_time': '2024-03-01T10:10:00'}, **fields}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = CollectorStore(os.path.join(temp_dir, 'collector.db'))
+            assert store.ingest([
+                session_end(1, minutes={}),
+                session_end(2, session={'category': ['basic_python']}),
+                session_end(2**70),
+                session_end(3)
+            ])
+            assert store.ingest([session_end(4)])
+
+            assert store.totals()['categories'] == {'basic_python': {'minutes': 20.0, 'sessions': 2, 'students': 1}}
+
+
+class TestBulkAggregator:
+    """Test the cohort aggregator over exported files and raw time logs"""
+
+    @staticmethod
+    def _write_export(path, student, minutes, score):
+        with open(path, 'w') as f:
+            json.dump({
+                'student_id': student,
+                'category_time': {'basic_python': minutes},
+                'total_active_time': minutes,
+                'submission_count': 1,
+                'efficiency_score': score
+            }, f)
+
+    def _build_tree(self, root):
+        """alice: a log (snapshot plus journal) and an export; bob: two exports; carol: a journal only"""
+        for student in ('alice', 'bob', 'carol'):
+            os.mkdir(os.path.join(root, student))
+        tracker = AssessmentTimeTracker(student_id='alice', log_file=os.path.join(root, 'alice', '.assessment_time_log.json'))
+        tracker._compact_in_background = lambda: None
+        tracker.record_session('basic_python', 1_700_000_000, 1_700_003_600)
+        self._write_export(os.path.join(root, 'alice', 'analytics_alice_20991231.json'), 'alice', 5.0, 10.0)
+        self._write_export(os.path.join(root, 'bob', 'analytics_bob_20240101.json'), 'bob', 30.0, 20.0)
+        self._write_export(os.path.join(root, 'bob', 'analytics_bob_20240301.json'), 'bob', 90.0, 45.0)
+        with open(os.path.join(root, 'carol', '.assessment_time_log.jsonl'), 'w') as f:
+            for seq, category in enumerate(('advanced_python', 'backend_development'), 1):
+                f.write(json.dumps({'seq': seq, 'type': 'session_end', 'minutes': 20.0, 'session': {
+                    'category': category,
+                    'start_time': '2024-03-01T10:00:00',
+                    'end_time': '2024-03-01T10:20:00',
+                    'duration_minutes': 20.0
+                }}) + '\n')
+
+    def test_tracker_files_and_rows(self):
+        """Test which files are found and what a journal-only log reduces to"""
+        sys.path.insert(0, ANALYTICS_DIR)
+        from bulk_aggregator import COLUMNS, find_tracker_files, summarize_file
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._build_tree(temp_dir)
+            found = sorted(os.path.relpath(path, temp_dir) for path in find_tracker_files(temp_dir))
+            assert found == [
+                os.path.join('alice', '.assessment_time_log.json'),
+                os.path.join('alice', 'analytics_alice_20991231.json'),
+                os.path.join('bob', 'analytics_bob_20240101.json'),
+                os.path.join('bob', 'analytics_bob_20240301.json'),
+                os.path.join('carol', '.assessment_time_log.jsonl')
+            ]
+
+            alice = dict(zip(COLUMNS, summarize_file(os.path.join(temp_dir, 'alice', '.assessment_time_log.json'))))
+            assert (alice['student'], alice['source'], alice['total_active_time']) == ('alice', 'log', 60.0)
+            carol = dict(zip(COLUMNS, summarize_file(os.path.join(temp_dir, 'carol', '.assessment_time_log.jsonl'))))
+            assert carol['source'] == 'log'
+            assert carol['session_count'] == 2
+            assert (carol['advanced_python'], carol['backend_development']) == (20.0, 20.0)
+            assert summarize_file(os.path.join(temp_dir, 'missing.json')) is None
+
+    def test_keep_prefers_log_then_newest_export(self):
+        """Test row precedence whatever order the files are parsed in"""
+        sys.path.insert(0, ANALYTICS_DIR)
+        from bulk_aggregator import BulkAggregator, summarize_file
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._build_tree(temp_dir)
+            rows = [
+                summarize_file(os.path.join(temp_dir, *parts)) for parts in (
+                    ('alice', '.assessment_time_log.json'),
+                    ('alice', 'analytics_alice_20991231.json'),
+                    ('bob', 'analytics_bob_20240301.json'),
+                    ('bob', 'analytics_bob_20240101.json')
+                )
+            ]
+            for ordered in (rows, rows[::-1]):
+                aggregator = BulkAggregator(temp_dir)
+                for row in ordered:
+                    aggregator._keep(row)
+                assert aggregator.rows['alice'][1] == 'log'
+                assert aggregator.rows['bob'][3] == '20240301'
+
+    def test_cohort_summary(self):
+        """Test collecting a tree end to end into cohort statistics"""
+        sys.path.insert(0, ANALYTICS_DIR)
+        from bulk_aggregator import BulkAggregator
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._build_tree(temp_dir)
+            aggregator = BulkAggregator(temp_dir, workers=1)
+            with redirect_stdout(StringIO()):
+                aggregator.collect()
+            summary = aggregator.cohort_summary()
+
+            assert (summary['files_scanned'], summary['files_skipped'], summary['students']) == (5, 0, 3)
+            assert summary['total_active_time'] == {'mean': 63.33, 'median': 60.0}
+            assert summary['category_distribution']['basic_python']['max'] == 90.0
+            assert sum(summary['efficiency_histogram'].values()) == 3
+            assert summary['efficiency_histogram']['40-50'] == 1
+
+
+@pytest.mark.slow
+class TestTimeLogConcurrency:
+    """Stress the tracker from many processes sharing one log"""
+
+    def test_parallel_sessions_and_submissions_are_merged(self):
+        """Test that no session or submission is lost under parallel writers"""
+        workers, rounds = 8, 15
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = os.path.join(temp_dir, 'log.json')
+            processes = [
+                multiprocessing.Process(target=_hammer_tracker, args=(log_file, i, rounds))
+                for i in range(workers)
+            ]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+                assert process.exitcode == 0
+
+            tracker = AssessmentTimeTracker(student_id='stress', log_file=log_file)
+            assert len(tracker.data['sessions']) == workers * rounds
+            assert tracker.data['submission_count'] == workers * rounds
+            assert tracker.get_summary().count(f"Sessions: {workers * rounds}") == 1
+
+    def test_threads_sharing_a_tracker_are_serialised(self):
+        """Test that a second thread never piggybacks on the first one's store lock"""
+        threads, rounds = 4, 50
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = os.path.join(temp_dir, 'log.json')
+            tracker = AssessmentTimeTracker(student_id='s1', log_file=log_file)
+            tracker._compact_in_background = lambda: None
+            interval = sys.getswitchinterval()
+            sys.setswitchinterval(1e-6)
+            try:
+                workers = [
+                    threading.Thread(target=lambda: [
+                        tracker.record_session('basic_python', 1_700_000_000, 1_700_000_060)
+                        for _ in range(rounds)
+                    ])
+                    for _ in range(threads)
+                ]
+                for worker in workers:
+                    worker.start()
+                for worker in workers:
+                    worker.join()
+            finally:
+                sys.setswitchinterval(interval)
+
+            seqs = [event['seq'] for event in tracker.store.read_journal()]
+            assert seqs == list(range(1, threads * rounds + 1))
+            assert AssessmentTimeTracker(log_file=log_file).data['total_active_time'] == threads * rounds
+
+    def test_concurrent_end_counts_session_once(self):
+        """Test that racing `end` calls record the active session exactly once"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = os.path.join(temp_dir, 'log.json')
+            with redirect_stdout(StringIO()):
+                AssessmentTimeTracker(log_file=log_file).start_session('basic_python')
+
+            processes = [
+                multiprocessing.Process(target=_end_shared_session, args=(log_file,))
+                for _ in range(8)
+            ]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+
+            assert len(AssessmentTimeTracker(log_file=log_file).data['sessions']) == 1
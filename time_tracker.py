@@ -3,12 +3,995 @@ Time Tracking Utility for Python Assessment
 This helps track how long students spend on each question category.
 """
 
+import atexit
+import ctypes
+import ctypes.util
 import json
+import mmap
+import select
+import socket
+import struct
+import subprocess
+import sys
+import threading
 import time
+import urllib.error
+import urllib.request
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 import os
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def _file_lock(fd):
+    """Hold an exclusive advisory lock on an open file descriptor"""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+# Question numbers covered by each graded category
+QUESTION_RANGES = {
+    'basic_python': range(1, 6),
+    'intermediate_python': range(6, 11),
+    'advanced_python': range(11, 16),
+    'backend_development': range(16, 21)
+}
+
+
+def question_category(question):
+    """Category that question number 1-20 belongs to"""
+    for category, questions in QUESTION_RANGES.items():
+        if question in questions:
+            return category
+    raise ValueError(f"Question number must be between 1 and 20, got {question}")
+
+
+def _empty_data(student_id):
+    """Fresh tracking data in the .assessment_time_log.json layout"""
+    return {
+        'student_id': student_id,
+        'assignment_start': datetime.now().isoformat(),
+        'sessions': [],
+        'category_time': {
+            'basic_python': 0,
+            'intermediate_python': 0,
+            'advanced_python': 0,
+            'backend_development': 0,
+            'setup_debugging': 0
+        },
+        'total_active_time': 0,
+        'submission_count': 0
+    }
+
+
+def apply_event(data, event):
+    """Fold one journal event into the aggregate tracking data or a rollup"""
+    kind = event.get('type')
+    if kind == 'session_end':
+        session = event['session']
+        minutes = event.get('minutes', session['duration_minutes'])
+        category = session['category']
+        if 'sessions' in data:
+            data['sessions'].append(session)
+        else:
+            # Rollups keep a session count and per-day/per-question totals
+            data['session_count'] += 1
+            _rollup_session(data, session)
+        data['category_time'][category] = data['category_time'].get(category, 0) + minutes
+        data['total_active_time'] += minutes
+    elif kind == 'submission':
+        data['submission_count'] += 1
+        data['last_submission'] = event['time']
+    # 'session_start' events carry no aggregate state; they are kept for auditing
+
+
+def _rollup_session(rollup, session):
+    """Add a session to the (day, category) and per-question rollups"""
+    minutes = session['duration_minutes']
+    day = rollup['daily_time'].setdefault(session['start_time'][:10], {})
+    day[session['category']] = round(day.get(session['category'], 0) + minutes, 2)
+    if session.get('question'):
+        key = f"Q{session['question']}"
+        rollup['question_time'][key] = round(rollup['question_time'].get(key, 0) + minutes, 2)
+
+
+def build_rollup(data, seq, snapshot_seq=0):
+    """
+    Summary-sized view of the tracking data, without the session list.
+    
+    Besides the category totals it carries daily_time ({day: {category:
+    minutes}}) and question_time ({'Q7': minutes}, for sessions started with
+    a question number), maintained incrementally as sessions end.
+    """
+    rollup = {
+        'student_id': data['student_id'],
+        'assignment_start': data['assignment_start'],
+        'category_time': dict(data['category_time']),
+        'total_active_time': data['total_active_time'],
+        'submission_count': data['submission_count'],
+        'last_submission': data.get('last_submission'),
+        'session_count': len(data['sessions']),
+        'journal_seq': seq,
+        'snapshot_seq': snapshot_seq,
+        'daily_time': {},
+        'question_time': {}
+    }
+    for session in data['sessions']:
+        _rollup_session(rollup, session)
+    return rollup
+
+
+class TimeLogStore:
+    """
+    Append-only storage for the time log.
+    
+    Events are appended as JSON lines to a journal next to the log file
+    (.assessment_time_log.jsonl); the log file itself is a snapshot in the
+    original format, rewritten only when the journal is compacted, which
+    happens once the journal holds as many events as the snapshot (see
+    needs_compaction). Both files are committed, and every reader
+    replays the journal on top of the snapshot. Every event carries a
+    sequence number and the snapshot records the last one it contains, so
+    replaying after an interrupted compaction never counts an event twice.
+    
+    Writers from several processes coordinate through an advisory lock on
+    .assessment_time_log.lock; whole-file writes go through a temp file and
+    os.replace so readers never see a partial snapshot. The lock file's
+    first 8 bytes record when a background compactor (fold_journal) last
+    reported in, so only one runs at a time.
+    """
+    
+    COMPACTOR = struct.Struct('<d')
+    # A compactor silent for this long is presumed dead and may be replaced
+    COMPACTOR_TIMEOUT = 60.0
+    
+    def __init__(self, log_file, fsync_every=8, compact_after=256):
+        self.log_file = Path(log_file)
+        self.journal_file = self.log_file.with_suffix('.jsonl')
+        self.rollup_file = self.log_file.with_suffix('.rollup.json')
+        self.lock_file = self.log_file.with_suffix('.lock')
+        self.fsync_every = fsync_every
+        self.compact_after = compact_after
+        self.snapshot_seq = 0
+        self._fd = None
+        self._unsynced = 0
+        # Threads sharing the store (e.g. a QuestionFileWatcher) queue here
+        # before the file lock; the depth belongs to the thread holding it
+        self._thread_lock = threading.RLock()
+        self._lock_depth = 0
+        self._lock_fd = None
+    
+    @contextmanager
+    def locked(self):
+        """Hold the store lock across threads and processes; re-entrant within a thread"""
+        with self._thread_lock:
+            if self._lock_depth:
+                self._lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth -= 1
+                return
+            fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                with _file_lock(fd):
+                    self._lock_depth = 1
+                    self._lock_fd = fd
+                    try:
+                        yield
+                    finally:
+                        self._lock_depth = 0
+                        self._lock_fd = None
+            finally:
+                os.close(fd)
+    
+    def load(self, student_id):
+        """Return (data, last_seq) from the snapshot plus the replayed journal"""
+        return self._load_consistent(student_id)[:2]
+    
+    def _load_consistent(self, student_id):
+        """
+        Load without the lock: retry if a compaction swapped the snapshot
+        (and emptied the journal) between reading one and the other. Also
+        returns the snapshot version the data was built from.
+        """
+        while True:
+            version = self._version(self.log_file)
+            if version is not None:
+                with open(self.log_file, 'r') as f:
+                    data = json.load(f)
+            else:
+                data = _empty_data(student_id)
+                # Journal-only log: the assignment started with its first event
+                first = next(self.read_journal(), None)
+                if first is not None:
+                    data['assignment_start'] = first.get('time') or first['session']['start_time']
+            # Logs written before the journal existed have no sequence marker
+            snapshot_seq = data.pop('journal_seq', 0)
+            seq = self.replay(data, snapshot_seq)
+            if self._version(self.log_file) == version:
+                self.snapshot_seq = snapshot_seq
+                return data, seq, version
+    
+    @staticmethod
+    def _version(path):
+        """Identity of the file at path, changed by every os.replace onto it"""
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+    
+    def replay(self, data, after_seq):
+        """Apply journal events newer than after_seq to data; return the last seq"""
+        seq = after_seq
+        for event in self.read_journal():
+            if event['seq'] <= seq:
+                continue
+            apply_event(data, event)
+            seq = event['seq']
+        return seq
+    
+    def read_journal(self):
+        """Yield journal events, skipping a torn trailing line from a crash"""
+        if not self.journal_file.exists():
+            return
+        with open(self.journal_file, 'rb') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+    
+    def append(self, event):
+        """Append one event as a single write; fsync every fsync_every events"""
+        if self._fd is None:
+            self._fd = os.open(self.journal_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            atexit.register(self.close)
+        os.write(self._fd, (json.dumps(event, separators=(',', ':')) + '\n').encode())
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every:
+            self.sync()
+    
+    def tail_seq(self):
+        """Sequence number of the last journal event, reading only the file tail"""
+        try:
+            with open(self.journal_file, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - 4096))
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return None
+        for line in reversed(lines):
+            try:
+                return json.loads(line)['seq']
+            except (ValueError, KeyError):
+                continue
+        return None
+    
+    def read_rollup(self):
+        """Return the rollup if it reflects the whole journal, otherwise None"""
+        try:
+            with open(self.rollup_file, 'r') as f:
+                rollup = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        tail = self.tail_seq()
+        if tail is not None and tail != rollup.get('journal_seq'):
+            return None
+        if 'daily_time' not in rollup:
+            # Written before per-day/per-question rollups existed
+            return None
+        return rollup
+    
+    def write_rollup(self, rollup):
+        # Derived data: rebuilt from snapshot + journal if lost, so no fsync
+        self._write_atomic(self.rollup_file, rollup, durable=False)
+    
+    def compact(self, data, seq):
+        """Atomically replace the snapshot with data, then empty the journal"""
+        self.sync()
+        self._write_atomic(self.log_file, {**data, 'journal_seq': seq}, indent=2)
+        with open(self.journal_file, 'a') as f:
+            f.truncate(0)
+        self.snapshot_seq = seq
+    
+    def ensure_snapshot(self, data):
+        """
+        Write data as the snapshot if there is none yet, so assignment_start
+        is on disk from the first event; journal_seq 0 keeps every journal
+        event applicable on top of it. Caller holds the lock.
+        """
+        if not self.log_file.exists():
+            self._write_atomic(self.log_file, {**data, 'journal_seq': 0}, indent=2)
+    
+    def needs_compaction(self, rollup):
+        """
+        True once the journal holds at least compact_after events and at
+        least as many as the snapshot already covers: each O(history)
+        rewrite is then paid for by as many appends, so the work per event
+        stays O(1) amortized however long the history grows.
+        """
+        snapshot_seq = rollup.get('snapshot_seq', 0)
+        return rollup['journal_seq'] - snapshot_seq >= max(self.compact_after, snapshot_seq)
+    
+    def claim_compactor(self):
+        """
+        Return True if no background compactor is running, recording that
+        the caller is about to start one. Caller holds the lock.
+        """
+        now = time.time()
+        if now - self._compactor_seen() < self.COMPACTOR_TIMEOUT:
+            return False
+        self._compactor_report(now)
+        return True
+    
+    def fold_journal(self, student_id):
+        """
+        Compact from a background process, keeping the committed snapshot
+        current without making writers wait for it.
+        
+        Unlike compact(), the lock is held only to swap the new snapshot in
+        and to empty the journal if nothing was appended meanwhile; parsing
+        and re-serialising the history happen outside it. Loops until the
+        snapshot covers the whole journal.
+        """
+        while True:
+            data, seq, version = self._load_consistent(student_id)
+            tmp_file = None
+            if seq > self.snapshot_seq:
+                tmp_file = self._write_temp(self.log_file, {**data, 'journal_seq': seq}, indent=2)
+            with self.locked():
+                if self._version(self.log_file) != version:
+                    # Compacted by someone else meanwhile; start over from theirs
+                    if tmp_file is not None:
+                        tmp_file.unlink()
+                    continue
+                if tmp_file is not None:
+                    os.replace(tmp_file, self.log_file)
+                    self.snapshot_seq = seq
+                    rollup = self.read_rollup()
+                    if rollup is not None:
+                        # Tells trackers holding session data that the journal moved on
+                        rollup['snapshot_seq'] = seq
+                        self.write_rollup(rollup)
+                if self.tail_seq() in (None, seq):
+                    with open(self.journal_file, 'a') as f:
+                        f.truncate(0)
+                    self._compactor_report(0.0)
+                    return
+                self._compactor_report(time.time())
+    
+    def _compactor_seen(self):
+        os.lseek(self._lock_fd, 0, os.SEEK_SET)
+        record = os.read(self._lock_fd, self.COMPACTOR.size)
+        return self.COMPACTOR.unpack(record)[0] if len(record) == self.COMPACTOR.size else 0.0
+    
+    def _compactor_report(self, when):
+        os.lseek(self._lock_fd, 0, os.SEEK_SET)
+        os.write(self._lock_fd, self.COMPACTOR.pack(when))
+    
+    def sync(self):
+        if self._fd is not None and self._unsynced:
+            os.fsync(self._fd)
+            self._unsynced = 0
+    
+    def close(self):
+        if self._fd is not None:
+            self.sync()
+            os.close(self._fd)
+            self._fd = None
+    
+    @classmethod
+    def _write_atomic(cls, path, payload, indent=None, durable=True):
+        os.replace(cls._write_temp(path, payload, indent, durable), path)
+    
+    @staticmethod
+    def _write_temp(path, payload, indent=None, durable=True):
+        """Write payload to a temp file next to path, ready for os.replace"""
+        tmp_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump(payload, indent=indent, fp=f)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        return tmp_file
+
+
+class ActiveSessionState:
+    """
+    The currently running session, shared by every CLI invocation.
+    
+    Stored as one fixed-size record (.assessment_time_log.state) that is read
+    and rewritten in place under an advisory lock, so `start_*` and `end`
+    from separate processes or terminals cost O(1) whatever the history size.
+    """
+    
+    RECORD = struct.Struct('<4s?Bd32s')
+    MAGIC = b'ATS2'
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self._fd = None
+        self._thread_lock = threading.Lock()
+    
+    @contextmanager
+    def locked(self):
+        """Open the state file and hold its lock for a read-modify-write"""
+        with self._thread_lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                with _file_lock(fd):
+                    self._fd = fd
+                    yield self
+            finally:
+                self._fd = None
+                os.close(fd)
+    
+    def read(self):
+        """Return (category, start_epoch, question) of the active session, or None"""
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        record = os.read(self._fd, self.RECORD.size)
+        if len(record) != self.RECORD.size:
+            return None
+        magic, active, question, start, category = self.RECORD.unpack(record)
+        if magic != self.MAGIC or not active:
+            return None
+        return category.rstrip(b'\0').decode(), start, question or None
+    
+    def write(self, category, start, question=None):
+        self._put(True, question or 0, start, category.encode())
+    
+    def clear(self):
+        self._put(False, 0, 0.0, b'')
+    
+    def _put(self, active, question, start, category):
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        os.write(self._fd, self.RECORD.pack(self.MAGIC, active, question, start, category))
+
+
+class BinarySessionLog:
+    """
+    Compact, optional store of finished sessions for long-running courses.
+    
+    A 16-byte header followed by fixed-width 16-byte records (start epoch,
+    minutes, category id, question number), kept in start order. Readers
+    mmap the file and unpack records in place, so totals never build
+    session dicts and a time-window query binary-searches to its first
+    record and reads only the records inside the window.
+    """
+    
+    HEADER = struct.Struct('<4sHH8x')
+    RECORD = struct.Struct('<dfBB2x')
+    MAGIC = b'ATSB'
+    VERSION = 1
+    CATEGORIES = (
+        'basic_python',
+        'intermediate_python',
+        'advanced_python',
+        'backend_development',
+        'setup_debugging',
+        'general'
+    )
+    
+    def __init__(self, path):
+        self.path = Path(path)
+    
+    def append(self, category, start, minutes, question=None):
+        """Add one session, keeping records in start order"""
+        record = self.RECORD.pack(start, minutes, self.CATEGORIES.index(category), question or 0)
+        with open(self.path, 'ab+') as f:
+            size = f.tell()
+            if size < self.HEADER.size:
+                f.truncate(0)
+                f.write(self.HEADER.pack(self.MAGIC, self.VERSION, self.RECORD.size) + record)
+                return
+            f.seek(size - self.RECORD.size)
+            if self.RECORD.unpack(f.read(self.RECORD.size))[0] <= start:
+                f.write(record)
+                return
+            # Rare (an inferred session closing after a later manual one): re-sort
+            f.seek(self.HEADER.size)
+            records = sorted([*self.RECORD.iter_unpack(f.read()), self.RECORD.unpack(record)])
+            f.truncate(self.HEADER.size)
+            f.write(b''.join(self.RECORD.pack(*fields) for fields in records))
+    
+    @contextmanager
+    def _mapped(self):
+        """Yield a read-only memoryview of the records (empty if there are none)"""
+        try:
+            f = open(self.path, 'rb')
+        except FileNotFoundError:
+            yield memoryview(b'')
+            return
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            if size <= self.HEADER.size:
+                yield memoryview(b'')
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                magic, version, record_size = self.HEADER.unpack_from(mapped)
+                if magic != self.MAGIC or version != self.VERSION or record_size != self.RECORD.size:
+                    raise ValueError(f"{self.path} is not a version {self.VERSION} session log")
+                end = self.HEADER.size + (size - self.HEADER.size) // record_size * record_size
+                view = memoryview(mapped)[self.HEADER.size:end]
+                try:
+                    yield view
+                finally:
+                    view.release()
+    
+    def __len__(self):
+        try:
+            size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            return 0
+        return max(0, size - self.HEADER.size) // self.RECORD.size
+    
+    def _window(self, view, since, until):
+        """Slice of view holding records with since <= start < until"""
+        record_size = self.RECORD.size
+        count = len(view) // record_size
+        
+        def first_at_or_after(epoch):
+            low, high = 0, count
+            while low < high:
+                middle = (low + high) // 2
+                if self.RECORD.unpack_from(view, middle * record_size)[0] < epoch:
+                    low = middle + 1
+                else:
+                    high = middle
+            return low
+        
+        first = 0 if since is None else first_at_or_after(_epoch(since))
+        last = count if until is None else first_at_or_after(_epoch(until))
+        return view[first * record_size:max(first, last) * record_size]
+    
+    def sessions(self, since=None, until=None):
+        """(category, start_epoch, minutes, question) tuples within the window"""
+        with self._mapped() as view:
+            for start, minutes, category, question in self.RECORD.iter_unpack(self._window(view, since, until)):
+                yield self.CATEGORIES[category], start, minutes, question or None
+    
+    def totals(self, since=None, until=None):
+        """Minutes per category for sessions starting within the window"""
+        minutes_by_id = [0.0] * len(self.CATEGORIES)
+        with self._mapped() as view:
+            for _, minutes, category, _ in self.RECORD.iter_unpack(self._window(view, since, until)):
+                minutes_by_id[category] += minutes
+        return {
+            category: round(minutes, 2)
+            for category, minutes in zip(self.CATEGORIES, minutes_by_id)
+            if minutes
+        }
+    
+    @classmethod
+    def from_log_data(cls, data, path):
+        """Write the sessions of .assessment_time_log.json data to a new binary log"""
+        log = cls(path)
+        log.path.unlink(missing_ok=True)
+        records = sorted(
+            ((datetime.fromisoformat(session['start_time']).timestamp(), session)
+             for session in data['sessions']),
+            key=lambda item: item[0]
+        )
+        with open(log.path, 'wb') as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, cls.RECORD.size))
+            for start, session in records:
+                f.write(cls.RECORD.pack(
+                    start,
+                    session['duration_minutes'],
+                    cls.CATEGORIES.index(session['category']),
+                    session.get('question') or 0
+                ))
+        return log
+    
+    def to_log_data(self, data):
+        """
+        Return data (in the .assessment_time_log.json layout) with its
+        sessions, category_time and total_active_time rebuilt from this log.
+        """
+        data = {**data, 'sessions': [], 'category_time': dict.fromkeys(data['category_time'], 0)}
+        data['total_active_time'] = 0
+        for category, start, minutes, question in self.sessions():
+            minutes = round(minutes, 2)
+            session = {
+                'category': category,
+                'start_time': datetime.fromtimestamp(start).isoformat(),
+                'end_time': datetime.fromtimestamp(start + minutes * 60).isoformat(),
+                'duration_minutes': minutes
+            }
+            if question:
+                session['question'] = question
+            data['sessions'].append(session)
+            data['category_time'][category] = data['category_time'].get(category, 0) + minutes
+            data['total_active_time'] += minutes
+        return data
+
+
+def _epoch(moment):
+    """Epoch seconds from a datetime or a number"""
+    return moment.timestamp() if isinstance(moment, datetime) else float(moment)
+
+class EventShipper:
+    """
+    Forwards tracker events to a lab collector (analytics/tracker_collector.py).
+    
+    Events are first appended to an on-disk spool
+    (.assessment_time_log.spool), so recording never waits on the network
+    and nothing is lost while the collector is down. A background thread
+    then claims the spool by renaming it to a batch file and POSTs each
+    batch to <url>/events, deleting it once accepted. Appends and claims
+    lock .assessment_time_log.spool.lock rather than the spool itself,
+    which Windows could not rename while it is held open. Batches that fail
+    stay on disk for the next attempt; the collector ignores duplicates.
+    Batch names carry the claiming process's pid and each process sends
+    only its own, adopting other processes' batches once they have been
+    left alone for ADOPT_AFTER seconds (e.g. a CLI run that exited first).
+    """
+    
+    ADOPT_AFTER = 60.0
+    
+    def __init__(self, url, spool_file, timeout=2.0):
+        self.url = url.rstrip('/') + '/events'
+        self.spool_file = Path(spool_file)
+        self.lock_file = self.spool_file.with_name(self.spool_file.name + '.lock')
+        self.timeout = timeout
+        self._thread = None
+        self._registered = False
+    
+    def ship(self, event):
+        """Spool one event and kick off a background send"""
+        line = (json.dumps(event, separators=(',', ':')) + '\n').encode()
+        with self._locked():
+            fd = os.open(self.spool_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self.flush, name='tracker-event-shipper', daemon=True)
+            self._thread.start()
+        if not self._registered:
+            atexit.register(self.close)
+            self._registered = True
+    
+    def flush(self):
+        """Send every spooled batch; return True if nothing is left over"""
+        for batch in self._claim():
+            try:
+                with open(batch, 'rb') as f:
+                    events = [json.loads(line) for line in f if line.strip()]
+            except FileNotFoundError:
+                # Adopted by another process after we listed it
+                continue
+            if events and not self._post(events):
+                return False
+            batch.unlink(missing_ok=True)
+        return True
+    
+    def close(self, timeout=None):
+        """Give an in-flight send a moment to finish before the process exits"""
+        if self._thread is not None:
+            self._thread.join(self.timeout if timeout is None else timeout)
+    
+    def _claim(self):
+        """Move the spool aside (under its lock) and list this process's unsent batches"""
+        with self._locked():
+            try:
+                if self.spool_file.stat().st_size:
+                    os.replace(self.spool_file, self._batch_name())
+            except FileNotFoundError:
+                pass
+        
+        own_prefix = f"{self.spool_file.name}.{os.getpid()}."
+        batches = []
+        for batch in sorted(self.spool_file.parent.glob(f"{self.spool_file.name}.*.batch")):
+            if not batch.name.startswith(own_prefix):
+                try:
+                    if time.time() - batch.stat().st_mtime < self.ADOPT_AFTER:
+                        continue
+                    # Whoever renames it first owns it
+                    adopted = self._batch_name()
+                    os.rename(batch, adopted)
+                except FileNotFoundError:
+                    continue
+                batch = adopted
+            batches.append(batch)
+        return batches
+    
+    def _batch_name(self):
+        return self.spool_file.with_name(f"{self.spool_file.name}.{os.getpid()}.{time.time_ns()}.batch")
+    
+    @contextmanager
+    def _locked(self):
+        """Hold the spool lock across threads and processes"""
+        fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            with _file_lock(fd):
+                yield
+        finally:
+            os.close(fd)
+    
+    def _post(self, events):
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps({'events': events}).encode(),
+            headers={'Content-Type': 'application/json'},
+            method='POST'
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return 200 <= response.status < 300
+        except (urllib.error.URLError, OSError, ValueError):
+            return False
+
+class _InotifySource:
+    """Edit events for a directory from Linux inotify (via libc and ctypes)"""
+    
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_TO = 0x080
+    EVENT = struct.Struct('iIII')
+    
+    def __init__(self, directory, files):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.files = files
+        # inotify_init1 is missing outside Linux; AttributeError means "poll instead"
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        # Watch the directory, not the files: editors often save by renaming over them
+        mask = self.IN_CLOSE_WRITE | self.IN_MOVED_TO
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), mask) < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), f'cannot watch {directory}')
+    
+    def wait(self, timeout):
+        """Block up to timeout seconds; return [(category, epoch_time), ...]"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        now = time.time()
+        buffer = os.read(self.fd, 64 * 1024)
+        events = []
+        offset = 0
+        while offset < len(buffer):
+            _, _, _, length = self.EVENT.unpack_from(buffer, offset)
+            start = offset + self.EVENT.size
+            name = buffer[start:start + length].rstrip(b'\0').decode(errors='replace')
+            offset = start + length
+            if name in self.files:
+                events.append((self.files[name], now))
+        return events
+    
+    def close(self):
+        os.close(self.fd)
+
+
+class _PollSource:
+    """Edit events from comparing file modification times every few seconds"""
+    
+    def __init__(self, directory, files, interval):
+        self.interval = interval
+        self.paths = {os.path.join(directory, name): category for name, category in files.items()}
+        self.mtimes = {path: self._mtime(path) for path in self.paths}
+        self.next_poll = time.time() + interval
+    
+    @staticmethod
+    def _mtime(path):
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+    
+    def wait(self, timeout):
+        delay = self.next_poll - time.time()
+        if delay > timeout:
+            time.sleep(timeout)
+            return []
+        time.sleep(max(0, delay))
+        self.next_poll = time.time() + self.interval
+        events = []
+        for path, category in self.paths.items():
+            mtime = self._mtime(path)
+            if mtime is not None and mtime != self.mtimes[path]:
+                self.mtimes[path] = mtime
+                events.append((category, mtime))
+        return events
+    
+    def close(self):
+        pass
+
+
+class QuestionFileWatcher:
+    """
+    Opt-in inference of work sessions from edits to the question files.
+    
+    Saves to questions/*.py are mapped to their category; consecutive saves
+    in one category form a session running from the first save to the last,
+    and a change of category or a gap longer than idle_timeout starts a new
+    one. Bursts of events within `debounce` seconds count as one save.
+    Finished sessions go through the tracker's journal and rollups like
+    manual ones, tagged 'source': 'watcher', and are skipped while a manual
+    session is running so the same minutes are never counted twice.
+    """
+    
+    WATCHED_FILES = {
+        'basic_python.py': 'basic_python',
+        'intermediate_python.py': 'intermediate_python',
+        'advanced_python.py': 'advanced_python',
+        'backend_development.py': 'backend_development'
+    }
+    
+    def __init__(self, tracker, questions_dir='questions', idle_timeout=300,
+                 debounce=2.0, poll_interval=5.0, use_inotify=True):
+        self.tracker = tracker
+        self.questions_dir = str(questions_dir)
+        self.idle_timeout = idle_timeout
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self._session = None  # [category, first_edit, last_edit]
+        self._pending = {}
+        self._last_event = 0
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def start(self):
+        """Run the watcher in a daemon thread"""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name='question-file-watcher', daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop watching and record the session in progress"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+    
+    def run(self):
+        """Watch until stop() is called (blocking)"""
+        source = self._open_source()
+        try:
+            while not self._stop.is_set():
+                for category, when in source.wait(self._next_timeout()):
+                    self._pending[category] = max(when, self._pending.get(category, 0))
+                    self._last_event = time.time()
+                self._tick(time.time())
+        finally:
+            source.close()
+            self._flush_pending()
+            self._close_session()
+    
+    def _open_source(self):
+        if self.use_inotify:
+            try:
+                return _InotifySource(self.questions_dir, self.WATCHED_FILES)
+            except (OSError, AttributeError, TypeError):
+                pass
+        return _PollSource(self.questions_dir, self.WATCHED_FILES, self.poll_interval)
+    
+    def _next_timeout(self):
+        """Sleep until the next debounce or idle deadline, waking at least once a second"""
+        now = time.time()
+        deadlines = [1.0]
+        if self._pending:
+            deadlines.append(self._last_event + self.debounce - now)
+        if self._session is not None:
+            deadlines.append(self._session[2] + self.idle_timeout - now)
+        return max(0.0, min(deadlines))
+    
+    def _tick(self, now):
+        if self._pending and now - self._last_event >= self.debounce:
+            self._flush_pending()
+        if self._session is not None and now - self._session[2] > self.idle_timeout:
+            self._close_session()
+    
+    def _flush_pending(self):
+        for category, when in sorted(self._pending.items(), key=lambda item: item[1]):
+            self.observe(category, when)
+        self._pending.clear()
+    
+    def observe(self, category, when):
+        """Account for a (debounced) save in category at epoch time `when`"""
+        if self._session is not None:
+            current, _, last_edit = self._session
+            if current == category and when - last_edit <= self.idle_timeout:
+                self._session[2] = max(last_edit, when)
+                return
+            self._close_session()
+        self._session = [category, when, when]
+    
+    def _close_session(self):
+        if self._session is None:
+            return
+        category, first_edit, last_edit = self._session
+        self._session = None
+        if last_edit <= first_edit:
+            return
+        with self.tracker.state.locked():
+            if self.tracker.state.read() is not None:
+                return
+            self.tracker.record_session(category, first_edit, last_edit, source='watcher')
+
+
+def efficiency_score(category_times):
+    """Efficiency (0-100) of a category_time split against the point weights"""
+    total_time = sum(category_times.values())
+    
+    if total_time == 0:
+        return 0
+    
+    # Ideal time distribution (based on point weights)
+    ideal_distribution = {
+        'basic_python': 0.20,      # 20 points = 20%
+        'intermediate_python': 0.25,  # 25 points = 25%
+        'advanced_python': 0.30,   # 30 points = 30%
+        'backend_development': 0.25  # 25 points = 25%
+    }
+    
+    # Calculate actual distribution
+    actual_distribution = {
+        category: time_spent / total_time 
+        for category, time_spent in category_times.items()
+        if category != 'setup_debugging'
+    }
+    
+    # Calculate efficiency (lower deviation = higher efficiency)
+    deviation = sum(
+        abs(actual_distribution.get(cat, 0) - ideal_distribution[cat])
+        for cat in ideal_distribution
+    )
+    
+    efficiency = max(0, 100 - (deviation * 100))
+    return round(efficiency, 1)
+
+
+def format_summary(rollup):
+    """Render the time tracking summary from a rollup (see build_rollup)"""
+    total_time = rollup['total_active_time']
+    
+    summary = f"""
+🕒 Assessment Time Summary for {rollup['student_id']}
+{'=' * 50}
+
+📊 Time by Category:
+• Basic Python (Q1-Q5):        {rollup['category_time']['basic_python']:.1f} min
+• Intermediate Python (Q6-Q10): {rollup['category_time']['intermediate_python']:.1f} min  
+• Advanced Python (Q11-Q15):    {rollup['category_time']['advanced_python']:.1f} min
+• Backend Development (Q16-Q20): {rollup['category_time']['backend_development']:.1f} min
+• Setup & Debugging:            {rollup['category_time']['setup_debugging']:.1f} min
+
+⏱️  Total Active Time: {total_time:.1f} minutes ({total_time/60:.1f} hours)
+📤 Total Submissions: {rollup['submission_count']}
+📅 Started: {rollup['assignment_start'][:19].replace('T', ' ')}
+
+🎯 Efficiency Metrics:
+• Average time per question: {total_time/20:.1f} minutes
+• Time per point: {total_time/100:.1f} minutes
+• Sessions: {rollup['session_count']}
+"""
+    return summary
+
 
 class AssessmentTimeTracker:
     """
@@ -16,115 +999,220 @@ class AssessmentTimeTracker:
     Automatically logs work sessions and generates analytics.
     """
     
-    def __init__(self, student_id=None):
+    def __init__(self, student_id=None, log_file=None, binary_sessions=False, collector_url=None):
         self.student_id = student_id or os.getenv('GITHUB_USER', 'anonymous')
-        self.log_file = Path('.assessment_time_log.json')
+        self.log_file = Path(log_file or default_log_file())
+        self.store = TimeLogStore(self.log_file)
+        self.state = ActiveSessionState(self.log_file.with_suffix('.state'))
+        # Optional compact copy of the sessions for fast time-window queries
+        self.binary_log = BinarySessionLog(self.log_file.with_suffix('.sessions.bin')) if binary_sessions else None
+        # Optional live feed to a lab collector daemon
+        collector_url = collector_url or os.getenv('ASSESSMENT_COLLECTOR_URL')
+        self.shipper = EventShipper(collector_url, self.log_file.with_suffix('.spool')) if collector_url else None
         self.session_start = None
         self.current_category = None
-        self.load_existing_data()
+        # Loaded on demand: start/end only need the rollup, not the sessions
+        self._data = None
+        self._data_seq = None
+        self._rollup = None
+    
+    @property
+    def data(self):
+        if self._data is None:
+            self.load_existing_data()
+        return self._data
+    
+    @property
+    def journal_seq(self):
+        return self._refresh()['journal_seq']
     
     def load_existing_data(self):
-        """Load existing time tracking data"""
-        if self.log_file.exists():
-            with open(self.log_file, 'r') as f:
-                self.data = json.load(f)
-        else:
-            self.data = {
-                'student_id': self.student_id,
-                'assignment_start': datetime.now().isoformat(),
-                'sessions': [],
-                'category_time': {
-                    'basic_python': 0,
-                    'intermediate_python': 0,
-                    'advanced_python': 0,
-                    'backend_development': 0,
-                    'setup_debugging': 0
-                },
-                'total_active_time': 0,
-                'submission_count': 0
-            }
+        """Load existing time tracking data (snapshot plus journal replay)"""
+        self._data, self._data_seq = self.store.load(self.student_id)
+        self._rollup = build_rollup(self._data, self._data_seq, self.store.snapshot_seq)
     
-    def start_session(self, category='general'):
-        """Start tracking a work session"""
-        self.session_start = time.time()
-        self.current_category = category
-        print(f"⏱️  Started tracking time for: {category}")
+    def _refresh(self):
+        """
+        Bring the rollup (and the session data, if loaded) up to date with
+        events other processes have written, reading the full log only when
+        the rollup is missing or stale.
+        """
+        rollup = self.store.read_rollup()
+        if rollup is None:
+            self.load_existing_data()
+            if self.log_file.exists() or self.store.journal_file.exists():
+                self.store.write_rollup(self._rollup)
+            return self._rollup
+        if self._data is not None and rollup['journal_seq'] != self._data_seq:
+            if rollup.get('snapshot_seq', 0) > self._data_seq:
+                # Compacted past what we hold; the journal no longer has the gap
+                self.load_existing_data()
+            else:
+                self._data_seq = self.store.replay(self._data, self._data_seq)
+        self._rollup = rollup
+        return rollup
+    
+    def record_event(self, event):
+        """Append an event to the journal and fold it into the rollup and data"""
+        compact = False
+        with self.store.locked():
+            head = self._refresh()
+            self.store.ensure_snapshot({
+                **_empty_data(head['student_id']),
+                'assignment_start': head['assignment_start']
+            })
+            seq = head['journal_seq'] + 1
+            event = {'seq': seq, **event}
+            self.store.append(event)
+            apply_event(head, event)
+            head['journal_seq'] = seq
+            if self._data is not None:
+                apply_event(self._data, event)
+                self._data_seq = seq
+            self.store.write_rollup(head)
+            # Compaction rewrites the whole history, so it runs detached and
+            # only once the journal has grown in proportion to it
+            if self.store.needs_compaction(head):
+                compact = self.store.claim_compactor()
+        if compact:
+            self._compact_in_background()
+        if self.shipper is not None:
+            self.shipper.ship({**event, 'student_id': self.student_id, 'host': socket.gethostname()})
+    
+    def start_session(self, category='general', question=None):
+        """Start tracking a work session, optionally on one question (1-20)"""
+        if question is not None:
+            question = int(question)
+            if category == 'general':
+                category = question_category(question)
+            elif question not in QUESTION_RANGES.get(category, ()):
+                raise ValueError(f"Question {question} is not part of {category}")
+        self._check_category(category)
+        with self.state.locked():
+            if self.state.read() is not None:
+                # Only one session runs at a time, whichever terminal started it
+                self._finish_session()
+            self.session_start = time.time()
+            self.current_category = category
+            self.state.write(category, self.session_start, question)
+            self.record_event({
+                'type': 'session_start',
+                'category': category,
+                'question': question,
+                'time': datetime.fromtimestamp(self.session_start).isoformat()
+            })
+        label = f"{category} (Q{question})" if question else category
+        print(f"⏱️  Started tracking time for: {label}")
         print(f"   Current session started at: {datetime.now().strftime('%H:%M:%S')}")
     
     def end_session(self):
         """End current tracking session"""
-        if self.session_start is None:
-            print("⚠️  No active session to end")
-            return
+        with self.state.locked():
+            if self.state.read() is None:
+                self.session_start = None
+                self.current_category = None
+                print("⚠️  No active session to end")
+                return
+            self._finish_session()
+    
+    def _finish_session(self):
+        """Record the active session from the state file; caller holds its lock"""
+        self.current_category, self.session_start, question = self.state.read()
+        session_minutes = self.record_session(
+            self.current_category, self.session_start, time.time(), question
+        )
+        self.state.clear()
         
-        session_duration = time.time() - self.session_start
-        session_minutes = session_duration / 60
+        print(f"⏹️  Session ended: {round(session_minutes, 1)} minutes on {self.current_category}")
+        
+        self.session_start = None
+        self.current_category = None
+    
+    def record_session(self, category, start, end, question=None, source=None):
+        """Log a finished session between two epoch times; returns its minutes"""
+        session_minutes = (end - start) / 60
         
         # Log the session
         session_data = {
-            'category': self.current_category,
-            'start_time': datetime.fromtimestamp(self.session_start).isoformat(),
-            'end_time': datetime.now().isoformat(),
+            'category': category,
+            'start_time': datetime.fromtimestamp(start).isoformat(),
+            'end_time': datetime.fromtimestamp(end).isoformat(),
             'duration_minutes': round(session_minutes, 2)
         }
+        if question:
+            session_data['question'] = question
+        if source:
+            session_data['source'] = source
         
-        self.data['sessions'].append(session_data)
-        self.data['category_time'][self.current_category] += session_minutes
-        self.data['total_active_time'] += session_minutes
-        
-        print(f"⏹️  Session ended: {round(session_minutes, 1)} minutes on {self.current_category}")
-        
-        self.save_data()
-        self.session_start = None
-        self.current_category = None
+        # Before the journal write, so a failed binary append cannot follow it
+        self._check_category(category)
+        with self.store.locked():
+            self.record_event({
+                'type': 'session_end',
+                'session': session_data,
+                'minutes': session_minutes
+            })
+            if self.binary_log is not None:
+                self.binary_log.append(category, start, session_minutes, question)
+        return session_minutes
+    
+    def _check_category(self, category):
+        """Reject categories the binary session log has no id for"""
+        if self.binary_log is not None and category not in BinarySessionLog.CATEGORIES:
+            raise ValueError(f"Unknown category for binary_sessions: {category}")
     
     def log_submission(self):
         """Log when student submits (pushes to GitHub)"""
-        self.data['submission_count'] += 1
-        self.data['last_submission'] = datetime.now().isoformat()
-        self.save_data()
-        print(f"📤 Submission #{self.data['submission_count']} logged")
+        # The journal is committed with the snapshot, so the push carries the event as is
+        self.record_event({'type': 'submission', 'time': datetime.now().isoformat()})
+        print(f"📤 Submission #{self._rollup['submission_count']} logged")
     
     def save_data(self):
-        """Save tracking data to file"""
-        with open(self.log_file, 'w') as f:
-            json.dump(self.data, indent=2, fp=f)
+        """Compact the journal into a fresh snapshot of the time log"""
+        with self.store.locked():
+            # Rebuild from disk so other processes' events are merged, not overwritten
+            self.load_existing_data()
+            self.store.compact(self._data, self._data_seq)
+            self._rollup['snapshot_seq'] = self._data_seq
+            self.store.write_rollup(self._rollup)
+    
+    def _compact_in_background(self):
+        """Run `time_tracker.py compact` for this log in a detached process"""
+        _compactors[:] = [process for process in _compactors if process.poll() is None]
+        try:
+            _compactors.append(subprocess.Popen(
+                [sys.executable, os.path.abspath(__file__), '--log-file', str(self.log_file.resolve()), 'compact'],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            ))
+        except OSError:
+            # A later event tries again once the claim times out
+            pass
+    
+    def compact_log(self):
+        """Fold the journal into the time log snapshot (see TimeLogStore.fold_journal)"""
+        self.store.fold_journal(self.student_id)
     
     def get_summary(self):
         """Generate time tracking summary"""
-        total_time = self.data['total_active_time']
-        
-        summary = f"""
-🕒 Assessment Time Summary for {self.data['student_id']}
-{'=' * 50}
-
-📊 Time by Category:
-• Basic Python (Q1-Q5):        {self.data['category_time']['basic_python']:.1f} min
-• Intermediate Python (Q6-Q10): {self.data['category_time']['intermediate_python']:.1f} min  
-• Advanced Python (Q11-Q15):    {self.data['category_time']['advanced_python']:.1f} min
-• Backend Development (Q16-Q20): {self.data['category_time']['backend_development']:.1f} min
-• Setup & Debugging:            {self.data['category_time']['setup_debugging']:.1f} min
-
-⏱️  Total Active Time: {total_time:.1f} minutes ({total_time/60:.1f} hours)
-📤 Total Submissions: {self.data['submission_count']}
-📅 Started: {self.data['assignment_start'][:19].replace('T', ' ')}
-
-🎯 Efficiency Metrics:
-• Average time per question: {total_time/20:.1f} minutes
-• Time per point: {total_time/100:.1f} minutes
-• Sessions: {len(self.data['sessions'])}
-"""
-        return summary
+        return format_summary(self._refresh())
     
     def export_analytics(self):
         """Export detailed analytics for instructor review"""
+        self._refresh()
         analytics_file = f"analytics_{self.student_id}_{datetime.now().strftime('%Y%m%d')}.json"
         
         analytics_data = {
             **self.data,
             'completion_rate': self.estimate_completion_rate(),
             'efficiency_score': self.calculate_efficiency_score(),
-            'time_distribution': self.get_time_distribution()
+            'time_distribution': self.get_time_distribution(),
+            'rollups': {
+                'daily_time': self._rollup['daily_time'],
+                'question_time': self._rollup['question_time']
+            }
         }
         
         with open(analytics_file, 'w') as f:
@@ -135,7 +1223,7 @@ class AssessmentTimeTracker:
     
     def estimate_completion_rate(self):
         """Estimate how much of the assessment is completed based on time distribution"""
-        total_time = self.data['total_active_time']
+        total_time = self._refresh()['total_active_time']
         if total_time < 30:  # Less than 30 minutes
             return "Getting Started (0-25%)"
         elif total_time < 90:  # 30-90 minutes
@@ -149,116 +1237,186 @@ class AssessmentTimeTracker:
     
     def calculate_efficiency_score(self):
         """Calculate efficiency based on time distribution"""
-        category_times = self.data['category_time']
-        total_time = sum(category_times.values())
-        
-        if total_time == 0:
-            return 0
-        
-        # Ideal time distribution (based on point weights)
-        ideal_distribution = {
-            'basic_python': 0.20,      # 20 points = 20%
-            'intermediate_python': 0.25,  # 25 points = 25%
-            'advanced_python': 0.30,   # 30 points = 30%
-            'backend_development': 0.25  # 25 points = 25%
-        }
-        
-        # Calculate actual distribution
-        actual_distribution = {
-            category: time_spent / total_time 
-            for category, time_spent in category_times.items()
-            if category != 'setup_debugging'
-        }
-        
-        # Calculate efficiency (lower deviation = higher efficiency)
-        deviation = sum(
-            abs(actual_distribution.get(cat, 0) - ideal_distribution[cat])
-            for cat in ideal_distribution
-        )
-        
-        efficiency = max(0, 100 - (deviation * 100))
-        return round(efficiency, 1)
+        return efficiency_score(self._refresh()['category_time'])
     
     def get_time_distribution(self):
         """Get percentage time distribution"""
-        total_time = self.data['total_active_time']
+        rollup = self._refresh()
+        total_time = rollup['total_active_time']
         if total_time == 0:
             return {}
         
         return {
             category: round((time_spent / total_time) * 100, 1)
-            for category, time_spent in self.data['category_time'].items()
+            for category, time_spent in rollup['category_time'].items()
         }
+    
+    def get_window_summary(self, since=None, until=None):
+        """
+        Minutes per category for sessions starting in [since, until), given as
+        datetimes or epoch seconds. Served from the binary session log when
+        enabled (building it from the JSON log the first time), otherwise by
+        scanning the session list.
+        """
+        if self.binary_log is not None:
+            if len(self.binary_log) != self._refresh()['session_count']:
+                # Missing, or enabled after sessions were already recorded
+                with self.store.locked():
+                    BinarySessionLog.from_log_data(self.data, self.binary_log.path)
+            return self.binary_log.totals(since, until)
+        
+        low = float('-inf') if since is None else _epoch(since)
+        high = float('inf') if until is None else _epoch(until)
+        totals = {}
+        for session in self.data['sessions']:
+            if low <= datetime.fromisoformat(session['start_time']).timestamp() < high:
+                totals[session['category']] = round(totals.get(session['category'], 0) + session['duration_minutes'], 2)
+        return totals
+    
+    def get_daily_breakdown(self):
+        """Minutes per category for each day worked, from the rollup"""
+        return self._refresh()['daily_time']
+    
+    def get_question_breakdown(self):
+        """Minutes per question (Q1-Q20) for sessions started with a question"""
+        rollup = self._refresh()['question_time']
+        return dict(sorted(rollup.items(), key=lambda item: int(item[0][1:])))
+
+
+# Global tracker instance, created on first use so importing does no I/O
+_tracker = None
+_tracker_config = {}
+# Background compactors started by this process, kept until they exit
+_compactors = []
 
 
-# Global tracker instance
-tracker = AssessmentTimeTracker()
+def default_log_file():
+    """Log path from ASSESSMENT_TIME_LOG, or .assessment_time_log.json in the CWD"""
+    return os.getenv('ASSESSMENT_TIME_LOG', '.assessment_time_log.json')
+
+
+def configure(log_file=None, student_id=None, binary_sessions=False, collector_url=None):
+    """Set where the global tracker keeps its log; resets any existing tracker"""
+    global _tracker
+    _tracker_config.clear()
+    _tracker_config.update(
+        log_file=log_file,
+        student_id=student_id,
+        binary_sessions=binary_sessions,
+        collector_url=collector_url
+    )
+    _tracker = None
+
+
+def get_tracker():
+    """Return the global tracker, loading its log on first call"""
+    global _tracker
+    if _tracker is None:
+        _tracker = AssessmentTimeTracker(**_tracker_config)
+    return _tracker
+
+
+def __getattr__(name):
+    # Keeps `time_tracker.tracker` working without building it at import time
+    if name == 'tracker':
+        return get_tracker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Convenience functions for easy use
-def start_basic_python():
+def start_basic_python(question=None):
     """Start timing Basic Python questions (Q1-Q5)"""
-    tracker.start_session('basic_python')
+    get_tracker().start_session('basic_python', question)
 
-def start_intermediate_python():
+def start_intermediate_python(question=None):
     """Start timing Intermediate Python questions (Q6-Q10)"""
-    tracker.start_session('intermediate_python')
+    get_tracker().start_session('intermediate_python', question)
 
-def start_advanced_python():
+def start_advanced_python(question=None):
     """Start timing Advanced Python questions (Q11-Q15)"""
-    tracker.start_session('advanced_python')
+    get_tracker().start_session('advanced_python', question)
 
-def start_backend_development():
+def start_backend_development(question=None):
     """Start timing Backend Development questions (Q16-Q20)"""
-    tracker.start_session('backend_development')
+    get_tracker().start_session('backend_development', question)
 
 def start_setup_debugging():
     """Start timing setup or debugging activities"""
-    tracker.start_session('setup_debugging')
+    get_tracker().start_session('setup_debugging')
 
 def end_session():
     """End current timing session"""
-    tracker.end_session()
+    get_tracker().end_session()
 
 def log_submission():
     """Log a submission (call this before git push)"""
-    tracker.log_submission()
+    get_tracker().log_submission()
 
 def show_summary():
     """Show time tracking summary"""
-    print(tracker.get_summary())
+    # Served from the rollup; the full session list is only read if it is stale
+    print(get_tracker().get_summary())
 
 def export_data():
     """Export analytics data for instructor"""
-    return tracker.export_analytics()
+    return get_tracker().export_analytics()
+
+def compact_log():
+    """Fold the journal into .assessment_time_log.json (started in the background as the journal grows)"""
+    get_tracker().compact_log()
+
+def watch_questions(questions_dir='questions'):
+    """Infer sessions from edits to the question files until Ctrl+C"""
+    watcher = QuestionFileWatcher(get_tracker(), questions_dir)
+    print(f"👀 Watching {questions_dir}/ for edits (Ctrl+C to stop)")
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        pass
+    print("👋 Stopped watching")
 
 
 if __name__ == "__main__":
     # Command line interface
-    import sys
+    args = sys.argv[1:]
+    if '--log-file' in args:
+        index = args.index('--log-file')
+        configure(log_file=args[index + 1] if index + 1 < len(args) else None)
+        del args[index:index + 2]
     
-    if len(sys.argv) < 2:
-        print("Usage: python time_tracker.py [start_basic|start_intermediate|start_advanced|start_backend|start_setup|end|submit|summary|export]")
+    if not args:
+        print("Usage: python time_tracker.py [--log-file PATH] [start_basic|start_intermediate|start_advanced|start_backend|start_setup|end|submit|summary|export|watch|compact] [QUESTION]")
         sys.exit(1)
     
-    command = sys.argv[1]
-    
-    if command == 'start_basic':
-        start_basic_python()
-    elif command == 'start_intermediate':
-        start_intermediate_python()
-    elif command == 'start_advanced':
-        start_advanced_python()
-    elif command == 'start_backend':
-        start_backend_development()
-    elif command == 'start_setup':
-        start_setup_debugging()
-    elif command == 'end':
-        end_session()
-    elif command == 'submit':
-        log_submission()
-    elif command == 'summary':
-        show_summary()
-    elif command == 'export':
-        export_data()
-    else:
-        print(f"Unknown command: {command}") 
\ No newline at end of file
+    command = args[0]
+    # Optional question number for start_* commands, e.g. `start_basic 3` or `start_basic Q3`
+    question = args[1].upper().lstrip('Q') if len(args) > 1 else None
+    
+    try:
+        if command == 'start_basic':
+            start_basic_python(question)
+        elif command == 'start_intermediate':
+            start_intermediate_python(question)
+        elif command == 'start_advanced':
+            start_advanced_python(question)
+        elif command == 'start_backend':
+            start_backend_development(question)
+        elif command == 'start_setup':
+            start_setup_debugging()
+        elif command == 'end':
+            end_session()
+        elif command == 'submit':
+            log_submission()
+        elif command == 'summary':
+            show_summary()
+        elif command == 'export':
+            export_data()
+        elif command == 'watch':
+            watch_questions()
+        elif command == 'compact':
+            compact_log()
+        else:
+            print(f"Unknown command: {command}")
+    except ValueError as e:
+        print(f"⚠️  {e}")
+        sys.exit(1)